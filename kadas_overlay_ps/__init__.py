@@ -24,5 +24,7 @@
 
 
 def classFactory(iface):
-    from .overlay_ps import OverlayPS
+    from .overlay_ps_profiler import runtimeProfile
+    with runtimeProfile("Overlay PS plugin import", "startup"):
+        from .overlay_ps import OverlayPS
     return OverlayPS(iface)
@@ -20,13 +20,12 @@
  *                                                                         *
  ***************************************************************************/
 """
+from qgis.PyQt import sip
 from qgis.PyQt.QtCore import *
 from qgis.PyQt.QtGui import *
 from qgis.PyQt.QtWidgets import *
 from kadas.kadasgui import *
-from . import resources_rc
-from .overlay_ps_tool import OverlayPSTool
-from .overlay_ps_layer import OverlayPSLayerType
+from .overlay_ps_layer import OverlayPSLayerType, geometryExecutor
 import os.path
 from qgis.core import *
 
@@ -76,7 +75,12 @@ class OverlayPS:
 
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
-        icon_path = ':/plugins/OverlayPS/icon.png'
+        from .overlay_ps_profiler import runtimeProfile
+        with runtimeProfile("Overlay PS plugin", "startup"):
+            self.setupGui()
+
+    def setupGui(self):
+        icon_path = os.path.join(self.plugin_dir, 'icon.png')
         icon = QIcon(icon_path)
 
         self.action = QAction(icon, self.tr(u'Overlay PS'),
@@ -87,6 +91,22 @@ class OverlayPS:
         self.iface.addAction(self.action, self.iface.PLUGIN_MENU,
                              self.iface.DRAW_TAB)
 
+        self.importAction = QAction(icon, self.tr(u'Import Overlay PS'),
+                                    self.iface.mainWindow())
+        self.importAction.triggered.connect(self.importOverlays)
+        self.iface.addAction(self.importAction, self.iface.PLUGIN_MENU,
+                             self.iface.DRAW_TAB)
+        self.importTasks = []
+
+        self.feedAction = QAction(icon, self.tr(u'Overlay PS position feed'),
+                                  self.iface.mainWindow())
+        self.feedAction.setCheckable(True)
+        self.feedAction.toggled.connect(self.feedToggled)
+        self.iface.addAction(self.feedAction, self.iface.PLUGIN_MENU,
+                             self.iface.DRAW_TAB)
+        self.feed = None
+        self.positionItem = None
+
         self.pluginLayerType = OverlayPSLayerType(self.action)
         QgsApplication.pluginLayerRegistry().addPluginLayerType(
             self.pluginLayerType)
@@ -94,14 +114,91 @@ class OverlayPS:
     def unload(self):
         self.iface.removeAction(self.action, self.iface.PLUGIN_MENU,
                                 self.iface.DRAW_TAB)
+        self.iface.removeAction(self.importAction, self.iface.PLUGIN_MENU,
+                                self.iface.DRAW_TAB)
+        self.feedAction.setChecked(False)
+        self.iface.removeAction(self.feedAction, self.iface.PLUGIN_MENU,
+                                self.iface.DRAW_TAB)
+        if self.feed:
+            self.feed.stopped.disconnect(self.feedStopped)
+            self.feed.stop()
+            self.feed.deleteLater()
+            self.feed = None
+        if self.positionItem:
+            self.iface.mapCanvas().scene().removeItem(self.positionItem)
+            self.positionItem = None
         QgsApplication.pluginLayerRegistry().removePluginLayerType(
             self.pluginLayerType.name())
+        # The module and its thread pool are recreated on reload
+        geometryExecutor.shutdown(wait=False, cancel_futures=True)
 
     def toolToggled(self, active):
         if active:
+            # The tool parses its widget form on import, defer it to first use
+            from .overlay_ps_tool import OverlayPSTool
             self.overlay_tool = OverlayPSTool(self.iface)
             self.overlay_tool.setAction(self.action)
             self.iface.mapCanvas().setMapTool(self.overlay_tool)
         elif self.iface.mapCanvas().mapTool() and self.iface.mapCanvas().mapTool().action() == self.action:
             self.iface.mapCanvas().unsetMapTool(self.iface.mapCanvas().mapTool())
             self.overlay_tool = None
+
+    def importOverlays(self):
+        from .overlay_ps_import import OverlayPSImportDialog, importOverlays
+        dialog = OverlayPSImportDialog(self.iface.mainWindow())
+        accepted = dialog.exec_() == QDialog.Accepted and \
+            dialog.sourceLayer is not None
+        # The task keeps its own feature source of the file layer
+        sourceLayer = dialog.sourceLayer
+        azimutField = dialog.azimutField()
+        dialog.deleteLater()
+        if not accepted:
+            return
+        layer, task = importOverlays(
+            sourceLayer, azimutField, sourceLayer.name(),
+            self.iface.mapCanvas().mapSettings().destinationCrs())
+        # The task manager does not keep the Python wrapper alive
+        self.importTasks = [task for task in self.importTasks
+                            if not sip.isdeleted(task)] + [task]
+
+    def feedToggled(self, active):
+        from .overlay_ps_feed import OverlayPSPositionFeed, \
+            OverlayPSPositionItem
+        if not active:
+            if self.feed:
+                self.feed.stop()
+            return
+        source, ok = QInputDialog.getText(
+            self.iface.mainWindow(), self.tr(u'Overlay PS position feed'),
+            self.tr(u'NMEA source (host:port or log file):'),
+            QLineEdit.Normal,
+            QSettings().value('kadas_overlay_ps/feedSource',
+                              'localhost:10110'))
+        if not ok or not source:
+            self.feedAction.setChecked(False)
+            return
+        QSettings().setValue('kadas_overlay_ps/feedSource', source)
+
+        if not self.feed:
+            self.feed = OverlayPSPositionFeed()
+            self.positionItem = OverlayPSPositionItem(
+                self.iface.mapCanvas())
+            self.feed.positionChanged.connect(self.positionItem.setPosition)
+            self.feed.stopped.connect(self.feedStopped)
+        try:
+            if os.path.isfile(source):
+                self.feed.replay(source)
+            else:
+                host, port = source.rsplit(':', 1)
+                self.feed.connectToHost(host, int(port))
+        except (OSError, ValueError) as e:
+            self.feedStopped(str(e))
+
+    def feedStopped(self, message):
+        self.positionItem.clear()
+        self.feedAction.blockSignals(True)
+        self.feedAction.setChecked(False)
+        self.feedAction.blockSignals(False)
+        if message:
+            self.iface.messageBar().pushMessage(
+                self.tr(u'Overlay PS position feed'), message, Qgis.Info)
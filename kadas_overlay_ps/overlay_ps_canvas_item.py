@@ -0,0 +1,78 @@
+from qgis.PyQt.QtCore import *
+from qgis.PyQt.QtGui import *
+from qgis.core import *
+from qgis.gui import *
+
+from .overlay_ps_geometry import OverlayPSGeometry
+from .overlay_ps_layer import OverlayPSLabelCache, OverlayPSPainter, \
+    Renderer
+from .overlay_ps_transform import transformPool, transformCoords, \
+    mapToPixelCoords
+
+
+class OverlayPSCanvasItem(QgsMapCanvasItem):
+    """Overlay drawn directly on the map canvas, used to preview edits
+    without re-rendering the layer stack."""
+
+    def __init__(self, canvas):
+        QgsMapCanvasItem.__init__(self, canvas)
+
+        self.canvas = canvas
+        self.geometry = None
+        self.pixelsPerKm = 0
+        self.xs = None
+        self.ys = None
+        self.color = Qt.black
+        self.lineWidth = 3
+        self.fontSize = 10
+        self.transparency = 0
+        self.labelCache = OverlayPSLabelCache()
+
+    def setStyle(self, color, lineWidth, fontSize, transparency):
+        self.color = color
+        self.lineWidth = lineWidth
+        self.fontSize = fontSize
+        self.transparency = transparency
+        self.update()
+
+    def setOverlay(self, center, crs, azimut, template=None):
+        destCrs = self.canvas.mapSettings().destinationCrs()
+        mapUnitsPerPixel = self.canvas.mapUnitsPerPixel()
+        metersPerPixel = mapUnitsPerPixel * \
+            QgsUnitTypes.fromUnitToUnitFactor(destCrs.mapUnits(),
+                                              QgsUnitTypes.DistanceMeters)
+        tolerance = Renderer.maxChordError * metersPerPixel
+        self.pixelsPerKm = 1000. / max(metersPerPixel, 1E-9)
+        wgsCenter = transformPool.toWgs84(crs).transform(center)
+        self.geometry = OverlayPSGeometry(wgsCenter.x(), wgsCenter.y(),
+                                          azimut, tolerance,
+                                          template=template)
+        self.xs, self.ys = transformCoords(
+            transformPool.fromWgs84(destCrs), self.geometry.lons,
+            self.geometry.lats)
+
+        # leave room for the labels beyond the kilometer marks
+        rect = QgsRectangle(float(self.xs.min()), float(self.ys.min()),
+                            float(self.xs.max()), float(self.ys.max()))
+        self.setRect(rect.buffered(4 * self.fontSize * mapUnitsPerPixel))
+        self.update()
+
+    def paint(self, painter):
+        if self.geometry is None:
+            return
+        px, py = mapToPixelCoords(self.canvas.getCoordinateTransform(),
+                                  self.xs, self.ys)
+        px -= self.pos().x()
+        py -= self.pos().y()
+
+        painter.save()
+        OverlayPSPainter.setupPainter(
+            painter, self.color, self.lineWidth, self.fontSize,
+            self.transparency)
+        # blend with the rendered map below instead of replacing it
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        visible = OverlayPSPainter.visibleStages(
+            self.pixelsPerKm, self.fontSize, self.geometry.template)
+        OverlayPSPainter(self.geometry, px, py, self.labelCache,
+                         visible).draw(painter)
+        painter.restore()
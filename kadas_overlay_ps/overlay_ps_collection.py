@@ -0,0 +1,286 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+
+from qgis.PyQt.QtCore import *
+from qgis.PyQt.QtGui import *
+from qgis.core import *
+
+from .overlay_ps_geodesic import directBatch
+from .overlay_ps_geometry import OverlayPSGeometry
+from .overlay_ps_transform import transformPool, transformCoords
+
+
+class OverlayPSCollection:
+    """Overlays of a layer in collection mode.
+
+    Overlays are stored as arrays of center x/y in layer crs, azimut and
+    style index, and share the template of the layer. Everything derived
+    from them is kept in an OverlayPSPreparedCollection.
+    """
+
+    def __init__(self):
+        self.xs = np.empty(0)
+        self.ys = np.empty(0)
+        self.azimuts = np.empty(0)
+        self.styleIndices = np.empty(0, dtype=np.int32)
+        # List of (QColor, lineWidth, fontSize)
+        self.styles = []
+        self.revision = 0
+        self.prepared = None
+
+    def invalidate(self):
+        self.revision += 1
+        self.prepared = None
+
+    def count(self):
+        return len(self.xs)
+
+    def addStyle(self, color, lineWidth, fontSize):
+        """Adds a style and returns its index."""
+        self.styles.append((QColor(color), lineWidth, fontSize))
+        self.revision += 1
+        return len(self.styles) - 1
+
+    def addOverlays(self, xs, ys, azimuts, styleIndices=0):
+        """Appends overlays given by arrays of center coordinates in layer
+        crs, azimuts in degrees and style indices."""
+        xs, ys, azimuts, styleIndices = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(xs, dtype=float)),
+            np.atleast_1d(np.asarray(ys, dtype=float)),
+            np.atleast_1d(np.asarray(azimuts, dtype=float)),
+            np.atleast_1d(np.asarray(styleIndices, dtype=np.int32)))
+        self.xs = np.concatenate([self.xs, xs])
+        self.ys = np.concatenate([self.ys, ys])
+        self.azimuts = np.concatenate([self.azimuts, azimuts])
+        self.styleIndices = np.concatenate([self.styleIndices, styleIndices])
+        self.invalidate()
+
+    def clear(self):
+        self.xs = np.empty(0)
+        self.ys = np.empty(0)
+        self.azimuts = np.empty(0)
+        self.styleIndices = np.empty(0, dtype=np.int32)
+        self.styles = []
+        self.invalidate()
+
+    def prepare(self, crs, template):
+        """Returns the OverlayPSPreparedCollection of the overlays for the
+        given layer crs and template, preparing it if not done yet."""
+        key = (self.revision, transformPool.crsKey(crs), template.key,
+               transformPool.revision)
+        if self.prepared is None or self.prepared.key != key:
+            self.prepared = OverlayPSPreparedCollection(
+                key, self.xs, self.ys, self.azimuts, self.styleIndices,
+                crs, template)
+        return self.prepared
+
+    def readXml(self, element):
+        self.clear()
+        styles = element.elementsByTagName("style")
+        for i in range(styles.count()):
+            styleEl = styles.at(i).toElement()
+            self.addStyle(
+                QgsSymbolLayerUtils.decodeColor(styleEl.attribute("color")),
+                int(styleEl.attribute("lineWidth")),
+                int(styleEl.attribute("fontSize")))
+        overlays = element.elementsByTagName("overlay")
+        xs = []
+        ys = []
+        azimuts = []
+        styleIndices = []
+        for i in range(overlays.count()):
+            overlayEl = overlays.at(i).toElement()
+            xs.append(float(overlayEl.attribute("x")))
+            ys.append(float(overlayEl.attribute("y")))
+            azimuts.append(float(overlayEl.attribute("azimut")))
+            styleIndices.append(int(overlayEl.attribute("style", "0")))
+        self.addOverlays(xs, ys, azimuts, styleIndices)
+
+    def writeXml(self, element, document):
+        for color, lineWidth, fontSize in self.styles:
+            styleEl = document.createElement("style")
+            styleEl.setAttribute("color",
+                                 QgsSymbolLayerUtils.encodeColor(color))
+            styleEl.setAttribute("lineWidth", lineWidth)
+            styleEl.setAttribute("fontSize", fontSize)
+            element.appendChild(styleEl)
+        for x, y, azimut, style in zip(self.xs, self.ys, self.azimuts,
+                                       self.styleIndices):
+            overlayEl = document.createElement("overlay")
+            overlayEl.setAttribute("x", float(x))
+            overlayEl.setAttribute("y", float(y))
+            overlayEl.setAttribute("azimut", float(azimut))
+            overlayEl.setAttribute("style", int(style))
+            element.appendChild(overlayEl)
+
+
+class OverlayPSPreparedCollection:
+    """Geographic centers, bounding boxes and spatial index of the
+    overlays of a collection for one layer crs and template, and their
+    geometry cached per chord tolerance.
+
+    Apart from the geometry cache, which is guarded by a lock, instances
+    are not modified after construction. Renderers can keep using them on
+    worker threads while the collection changes.
+    """
+
+    # Number of chord tolerances and of overlays per tolerance whose
+    # geometry is cached
+    maxTolerances = 4
+    maxCachedOverlays = 4096
+    # Maximum number of position and overlay pairs tested at once
+    maxPairs = 1 << 20
+
+    def __init__(self, key, xs, ys, azimuts, styleIndices, crs, template):
+        self.key = key
+        self.xs = xs
+        self.ys = ys
+        self.azimuts = azimuts
+        self.styleIndices = styleIndices
+        self.template = template
+        self.lock = threading.Lock()
+        self.geometryCache = OrderedDict()
+        self.wgsLons, self.wgsLats = transformCoords(
+            transformPool.toWgs84(crs), xs, ys)
+        # Use a common reference latitude for all batches, so that they
+        # share the same vertex layout
+        self.latitude = float(np.abs(self.wgsLats).max()) \
+            if len(xs) else 0.
+
+        # Project the overlay radius in the cardinal directions, with some
+        # slack for the grid convergence
+        radius = template.radius()
+        lons, lats = directBatch(
+            self.wgsLons[:, np.newaxis], self.wgsLats[:, np.newaxis],
+            np.array([0, 90, 180, 270]), radius)
+        xs, ys = transformCoords(transformPool.fromWgs84(crs), lons, lats)
+        xmin = xs.min(axis=1)
+        xmax = xs.max(axis=1)
+        ymin = ys.min(axis=1)
+        ymax = ys.max(axis=1)
+        dx = 0.01 * (xmax - xmin)
+        dy = 0.01 * (ymax - ymin)
+        self.bounds = np.column_stack(
+            [xmin - dx, ymin - dy, xmax + dx, ymax + dy])
+
+        self.index = QgsSpatialIndex()
+        for idx, bounds in enumerate(self.bounds):
+            self.index.addFeature(idx, QgsRectangle(*bounds))
+
+    def count(self):
+        return len(self.azimuts)
+
+    def extent(self):
+        """Returns the bounding box of all overlays."""
+        if not self.count():
+            return QgsRectangle()
+        return QgsRectangle(
+            float(self.bounds[:, 0].min()), float(self.bounds[:, 1].min()),
+            float(self.bounds[:, 2].max()), float(self.bounds[:, 3].max()))
+
+    def visible(self, rect):
+        """Returns the sorted indices of the overlays intersecting rect."""
+        if not self.count():
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.array(self.index.intersects(rect), dtype=np.int64))
+
+    def candidates(self, xs, ys):
+        """Returns the overlays each position in layer crs may be nearest
+        to, as arrays of (position index, overlay row) pairs sorted by
+        position. These are the overlays whose bounding box contains the
+        position, or the overlay with the nearest center for positions
+        outside of all bounding boxes."""
+        positions = [np.empty(0, dtype=np.int64)]
+        rows = [np.empty(0, dtype=np.int64)]
+        if not len(xs) or not self.count():
+            return positions[0], rows[0]
+        candidates = self.visible(QgsRectangle(
+            float(xs.min()), float(ys.min()),
+            float(xs.max()), float(ys.max())))
+        bounds = self.bounds[candidates]
+        # Test positions in chunks, bounding the size of the test matrices
+        chunk = max(1, self.maxPairs // max(1, len(candidates)))
+        for start in range(0, len(xs), chunk):
+            x = xs[start:start + chunk, np.newaxis]
+            y = ys[start:start + chunk, np.newaxis]
+            inside = (x >= bounds[:, 0]) & (y >= bounds[:, 1]) & \
+                (x <= bounds[:, 2]) & (y <= bounds[:, 3])
+            position, candidate = np.nonzero(inside)
+            positions.append(position + start)
+            rows.append(candidates[candidate])
+
+        outside = np.setdiff1d(np.arange(len(xs)),
+                               np.concatenate(positions))
+        chunk = max(1, self.maxPairs // max(1, self.count()))
+        for start in range(0, len(outside), chunk):
+            position = outside[start:start + chunk]
+            dx = xs[position, np.newaxis] - self.xs
+            dy = ys[position, np.newaxis] - self.ys
+            positions.append(position)
+            rows.append((dx * dx + dy * dy).argmin(axis=1))
+
+        positions = np.concatenate(positions)
+        rows = np.concatenate(rows)
+        order = np.argsort(positions, kind="stable")
+        return positions[order], rows[order]
+
+    def emptyGeometryEntry(self):
+        return {
+            # Row of the vertex arrays of each overlay, or -1
+            "slots": np.full(self.count(), -1, dtype=np.int64),
+            "size": 0,
+            "geometry": None
+        }
+
+    def geometry(self, rows, tolerance):
+        """Returns the geometry of the overlays at rows, computing the
+        overlays not cached yet for the given tolerance in one batch.
+
+        Only the computed overlays are stored, up to maxCachedOverlays per
+        tolerance, for the maxTolerances most recently used tolerances.
+        When full, only the cached overlays requested now are kept.
+        """
+        if not len(rows):
+            return None
+        with self.lock:
+            entry = self.geometryCache.pop(tolerance, None)
+            missing = rows if entry is None else \
+                rows[entry["slots"][rows] < 0]
+            if entry is None:
+                entry = self.emptyGeometryEntry()
+            elif len(missing) and \
+                    entry["size"] + len(missing) > self.maxCachedOverlays:
+                # Full, keep only the cached overlays requested now
+                kept = rows[entry["slots"][rows] >= 0]
+                keptSlots = entry["slots"][kept]
+                geometry = entry["geometry"]
+                entry = self.emptyGeometryEntry()
+                if len(kept):
+                    entry["slots"][kept] = np.arange(len(kept))
+                    entry["size"] = len(kept)
+                    entry["geometry"] = geometry.withVertices(
+                        geometry.lons[keptSlots], geometry.lats[keptSlots])
+            self.geometryCache[tolerance] = entry
+            while len(self.geometryCache) > self.maxTolerances:
+                self.geometryCache.popitem(last=False)
+
+            if len(missing):
+                geometry = OverlayPSGeometry(
+                    self.wgsLons[missing], self.wgsLats[missing],
+                    self.azimuts[missing], tolerance, self.latitude,
+                    template=self.template)
+                if entry["geometry"] is not None:
+                    geometry = geometry.withVertices(
+                        np.concatenate([entry["geometry"].lons,
+                                        geometry.lons]),
+                        np.concatenate([entry["geometry"].lats,
+                                        geometry.lats]))
+                entry["slots"][missing] = entry["size"] + \
+                    np.arange(len(missing))
+                entry["size"] += len(missing)
+                entry["geometry"] = geometry
+            slots = entry["slots"][rows]
+            geometry = entry["geometry"]
+        return geometry.withVertices(geometry.lons[slots],
+                                     geometry.lats[slots])
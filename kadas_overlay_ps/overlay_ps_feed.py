@@ -0,0 +1,165 @@
+from qgis.PyQt.QtCore import *
+from qgis.PyQt.QtGui import *
+from qgis.PyQt.QtNetwork import QTcpSocket
+from qgis.core import *
+from qgis.gui import *
+
+from .overlay_ps_layer import OverlayPSLayer
+from .overlay_ps_nmea import parseNmea
+from .overlay_ps_transform import transformPool
+
+
+class OverlayPSPositionFeed(QObject):
+    """Live positions from NMEA sentences received over TCP, or replayed
+    from a log file at a fixed rate.
+
+    Sentences are read as the socket notifies new data on the main event
+    loop, only the latest fix is kept.
+    """
+
+    positionChanged = pyqtSignal(float, float)
+    stopped = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        QObject.__init__(self, parent)
+        self.socket = None
+        self.replayFile = None
+        self.replayTimer = QTimer(self)
+        self.replayTimer.timeout.connect(self.replayNext)
+
+    def connectToHost(self, host, port):
+        self.stop()
+        self.socket = QTcpSocket(self)
+        self.socket.readyRead.connect(self.readSocket)
+        self.socket.disconnected.connect(
+            lambda: self.stop(self.tr("Position feed disconnected")))
+        self.socket.error.connect(
+            lambda error: self.stop(self.socket.errorString()))
+        self.socket.connectToHost(host, port)
+
+    def replay(self, path, rate=10):
+        """Replays the NMEA sentences of a log file, one per 1 / rate
+        seconds."""
+        self.stop()
+        self.replayFile = open(path, "r", errors="replace")
+        self.replayTimer.start(int(1000 / rate))
+
+    def stop(self, message=""):
+        active = self.isActive()
+        self.replayTimer.stop()
+        if self.replayFile:
+            self.replayFile.close()
+            self.replayFile = None
+        if self.socket:
+            socket = self.socket
+            self.socket = None
+            socket.blockSignals(True)
+            socket.abort()
+            socket.deleteLater()
+        if active:
+            self.stopped.emit(message)
+
+    def isActive(self):
+        return self.socket is not None or self.replayFile is not None
+
+    def readSocket(self):
+        position = None
+        while self.socket and self.socket.canReadLine():
+            line = bytes(self.socket.readLine()).decode("ascii", "replace")
+            position = parseNmea(line) or position
+        if position:
+            self.positionChanged.emit(*position)
+
+    def replayNext(self):
+        for line in self.replayFile:
+            position = parseNmea(line)
+            if position:
+                self.positionChanged.emit(*position)
+                return
+        self.stop(self.tr("Position replay finished"))
+
+
+class OverlayPSPositionItem(QgsMapCanvasItem):
+    """Current position, annotated with its kilometer mark and lateral
+    deviation relative to each visible overlay layer.
+
+    Only this item is repainted for a new position, the overlay layers
+    are not re-rendered.
+    """
+
+    markerSize = 12
+    axisNames = {"mainAxis": "MA", "flightLine": "FL"}
+
+    def __init__(self, canvas):
+        QgsMapCanvasItem.__init__(self, canvas)
+        self.canvas = canvas
+        self.point = None
+        self.annotations = []
+        self.setZValue(100)
+
+    def setPosition(self, lon, lat):
+        destCrs = self.canvas.mapSettings().destinationCrs()
+        try:
+            self.point = transformPool.fromWgs84(destCrs).transform(
+                QgsPointXY(lon, lat))
+        except QgsCsException:
+            return
+        self.annotations = self.annotate(lon, lat)
+
+        lines = max(1, len(self.annotations))
+        metrics = QFontMetricsF(QFont())
+        mapUnitsPerPixel = self.canvas.mapUnitsPerPixel()
+        width = max([metrics.width(text) for text in self.annotations] +
+                    [0]) + 2 * self.markerSize
+        height = lines * metrics.height() + 2 * self.markerSize
+        self.setRect(QgsRectangle(
+            self.point.x() - self.markerSize * mapUnitsPerPixel,
+            self.point.y() - height * mapUnitsPerPixel,
+            self.point.x() + width * mapUnitsPerPixel,
+            self.point.y() + self.markerSize * mapUnitsPerPixel))
+        self.update()
+
+    def annotate(self, lon, lat):
+        """Returns the annotation lines of the position."""
+        wgs84 = transformPool.wgs84Crs()
+        annotations = []
+        for layer in self.canvas.layers():
+            if not isinstance(layer, OverlayPSLayer):
+                continue
+            result = layer.queryPositions([lon], [lat], wgs84)
+            if result["axis"][0] < 0 or \
+                    result["distance"][0] > layer.getTemplate().radius():
+                continue
+            axis = layer.getTemplate().axes[result["axis"][0]]
+            cross = result["cross"][0]
+            annotations.append("%s: %s km %.1f, %s %d m" % (
+                layer.name(), self.axisNames.get(axis["kind"], ""),
+                result["along"][0] / 1000., "R" if cross >= 0 else "L",
+                abs(cross)))
+        return annotations
+
+    def clear(self):
+        self.point = None
+        self.annotations = []
+        self.update()
+
+    def paint(self, painter):
+        if self.point is None:
+            return
+        pos = self.toCanvasCoordinates(self.point) - self.pos()
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(Qt.white, 2))
+        painter.setBrush(QColor(220, 0, 0))
+        painter.drawEllipse(pos, 0.5 * self.markerSize, 0.5 * self.markerSize)
+
+        metrics = QFontMetricsF(painter.font())
+        x = pos.x() + self.markerSize
+        y = pos.y() - self.markerSize
+        for text in reversed(self.annotations):
+            path = QPainterPath()
+            path.addText(QPointF(x, y), painter.font(), text)
+            painter.strokePath(path, QPen(Qt.white, 3))
+            painter.fillPath(path, Qt.black)
+            y -= metrics.height()
+        painter.restore()
@@ -0,0 +1,138 @@
+import numpy as np
+
+# WGS84 ellipsoid
+A = 6378137.
+F = 1 / 298.257223563
+B = A * (1 - F)
+E2 = F * (2 - F)  # first eccentricity squared
+EP2 = (A * A - B * B) / (B * B)  # second eccentricity squared
+EARTH_RADIUS = 6371008.8  # mean radius
+
+
+def directBatch(lon, lat, azimuth, distance, tolerance=1E-12, maxIter=50):
+    """Solves the direct geodesic problem on the WGS84 ellipsoid (Vincenty)
+    for arrays of start points, azimuths and distances in one call.
+
+    All arguments are broadcast against each other. Angles are in degrees,
+    distances in meters.
+
+    :returns: Tuple of (lon, lat) numpy arrays of the destination points.
+    """
+    lon, lat, azimuth, distance = np.broadcast_arrays(
+        np.asarray(lon, dtype=float), np.asarray(lat, dtype=float),
+        np.asarray(azimuth, dtype=float), np.asarray(distance, dtype=float))
+
+    alpha1 = np.radians(azimuth)
+    sinAlpha1 = np.sin(alpha1)
+    cosAlpha1 = np.cos(alpha1)
+
+    tanU1 = (1 - F) * np.tan(np.radians(lat))
+    cosU1 = 1 / np.sqrt(1 + tanU1 * tanU1)
+    sinU1 = tanU1 * cosU1
+    sigma1 = np.arctan2(tanU1, cosAlpha1)
+    sinAlpha = cosU1 * sinAlpha1
+    cosSqAlpha = 1 - sinAlpha * sinAlpha
+    uSq = cosSqAlpha * (A * A - B * B) / (B * B)
+    a = 1 + uSq / 16384 * (4096 + uSq * (-768 + uSq * (320 - 175 * uSq)))
+    b = uSq / 1024 * (256 + uSq * (-128 + uSq * (74 - 47 * uSq)))
+
+    sigma0 = distance / (B * a)
+    sigma = sigma0
+    for i in range(maxIter):
+        cos2SigmaM = np.cos(2 * sigma1 + sigma)
+        sinSigma = np.sin(sigma)
+        cosSigma = np.cos(sigma)
+        deltaSigma = b * sinSigma * (cos2SigmaM + b / 4 * (
+            cosSigma * (-1 + 2 * cos2SigmaM * cos2SigmaM) -
+            b / 6 * cos2SigmaM * (-3 + 4 * sinSigma * sinSigma) *
+            (-3 + 4 * cos2SigmaM * cos2SigmaM)))
+        sigmaPrev = sigma
+        sigma = sigma0 + deltaSigma
+        if np.all(np.abs(sigma - sigmaPrev) <= tolerance):
+            break
+    cos2SigmaM = np.cos(2 * sigma1 + sigma)
+    sinSigma = np.sin(sigma)
+    cosSigma = np.cos(sigma)
+
+    x = sinU1 * sinSigma - cosU1 * cosSigma * cosAlpha1
+    lat2 = np.arctan2(sinU1 * cosSigma + cosU1 * sinSigma * cosAlpha1,
+                      (1 - F) * np.sqrt(sinAlpha * sinAlpha + x * x))
+    lam = np.arctan2(sinSigma * sinAlpha1,
+                     cosU1 * cosSigma - sinU1 * sinSigma * cosAlpha1)
+    c = F / 16 * cosSqAlpha * (4 + F * (4 - 3 * cosSqAlpha))
+    dLon = lam - (1 - c) * F * sinAlpha * (sigma + c * sinSigma * (
+        cos2SigmaM + c * cosSigma * (-1 + 2 * cos2SigmaM * cos2SigmaM)))
+
+    lon2 = (lon + np.degrees(dLon) + 180) % 360 - 180
+    return lon2, np.degrees(lat2)
+
+
+class TangentPlane:
+    """Local east/north tangent planes of the WGS84 ellipsoid at arrays of
+    origins, for geometries spanning a few kilometers.
+
+    Coordinates in the plane are in meters, angles in degrees.
+    """
+
+    def __init__(self, lon, lat):
+        self.lon = np.asarray(lon, dtype=float)
+        self.lat = np.asarray(lat, dtype=float)
+        sinLat = np.sin(np.radians(self.lat))
+        # prime vertical radius of curvature
+        self.n = A / np.sqrt(1 - E2 * sinLat * sinLat)
+        self.tanLat = np.tan(np.radians(self.lat))
+
+    def direct(self, east, north, azimuth, distance):
+        """Plane counterpart of directBatch(), for start points given in
+        plane coordinates. The azimuth is relative to the meridian of the
+        start point, which is rotated against the plane north by the
+        meridian convergence."""
+        bearing = np.radians(azimuth) - east * self.tanLat / self.n
+        return east + distance * np.sin(bearing), \
+            north + distance * np.cos(bearing)
+
+    def fromGeodetic(self, lon, lat):
+        """Returns the plane coordinates of points on the ellipsoid, as
+        seen from above.
+
+        :returns: Tuple of (east, north) numpy arrays.
+        """
+        lam0 = np.radians(self.lon)
+        phi0 = np.radians(self.lat)
+        lam = np.radians(lon)
+        phi = np.radians(lat)
+        sinPhi = np.sin(phi)
+        n = A / np.sqrt(1 - E2 * sinPhi * sinPhi)
+        sinPhi0 = np.sin(phi0)
+        cosPhi0 = np.cos(phi0)
+        # ECEF offsets, with the longitudes relative to the origin
+        dLam = lam - lam0
+        x = n * np.cos(phi) * np.cos(dLam) - self.n * cosPhi0
+        y = n * np.cos(phi) * np.sin(dLam)
+        z = n * (1 - E2) * sinPhi - self.n * (1 - E2) * sinPhi0
+        return y, -sinPhi0 * x + cosPhi0 * z
+
+    def toGeodetic(self, east, north):
+        """Projects plane coordinates along the ellipsoid normal.
+
+        :returns: Tuple of (lon, lat) numpy arrays.
+        """
+        lam = np.radians(self.lon)
+        phi = np.radians(self.lat)
+        sinLam = np.sin(lam)
+        cosLam = np.cos(lam)
+        sinPhi = np.sin(phi)
+        cosPhi = np.cos(phi)
+        x = (self.n * cosPhi - sinPhi * north) * cosLam - sinLam * east
+        y = (self.n * cosPhi - sinPhi * north) * sinLam + cosLam * east
+        z = self.n * (1 - E2) * sinPhi + cosPhi * north
+
+        # Bowring's formula, accurate to well below a millimeter near the
+        # ellipsoid surface
+        p = np.sqrt(x * x + y * y)
+        theta = np.arctan2(z * A, p * B)
+        sinTheta = np.sin(theta)
+        cosTheta = np.cos(theta)
+        lat = np.arctan2(z + EP2 * B * sinTheta ** 3,
+                         p - E2 * A * cosTheta ** 3)
+        return np.degrees(np.arctan2(y, x)), np.degrees(lat)
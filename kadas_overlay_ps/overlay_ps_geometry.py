@@ -0,0 +1,285 @@
+"""Overlay geometry generation.
+
+This module only depends on NumPy, so that the overlay geometry can be
+computed and measured without a running KADAS.
+"""
+import copy
+import math
+import numpy as np
+
+from .overlay_ps_geodesic import EARTH_RADIUS, TangentPlane, directBatch
+from .overlay_ps_template import OverlayPSTemplate
+
+# Maximum chord error in pixels of rendered overlays
+MAX_CHORD_ERROR = 0.25
+
+
+class OverlayPSGeometry:
+    """Geographic (EPSG:4326) vertices and kilometer marks of one or
+    several overlays."""
+
+    # Maximum error in meters of the tangent plane construction
+    planeTolerance = 0.1
+
+    def __init__(self, lon, lat, azimut, tolerance=None, latitude=None,
+                 planeTolerance=planeTolerance, template=None):
+        """Computes the geometry of one or several overlays at once.
+
+        :param lon: Longitude of the overlay centers in degrees, a scalar
+            or an array.
+        :param lat: Latitude of the overlay centers in degrees.
+        :param azimut: Azimut of the main axes in degrees.
+        :param tolerance: Maximum chord error in meters used to adapt the
+            vertex count of the rings and axes. If None, the rings are
+            tessellated per degree and the axes are sampled at their
+            kilometer mark spacing.
+        :param latitude: Latitude in degrees used to choose the axis
+            sampling, defaults to the largest absolute center latitude.
+            Geometries computed with the same template, tolerance and
+            latitude share the same vertex layout.
+        :param planeTolerance: If not None, the overlays are constructed
+            in the local tangent plane at their center, and those whose
+            outermost vertices deviate more than planeTolerance meters from
+            the geodesic solution are solved on the ellipsoid instead. If
+            None, all vertices are solved on the ellipsoid.
+        :param template: OverlayPSTemplate of the overlays, defaults to the
+            standard PS overlay.
+        """
+        lon, lat, azimut = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(lon, dtype=float)),
+            np.atleast_1d(np.asarray(lat, dtype=float)),
+            np.atleast_1d(np.asarray(azimut, dtype=float)))
+        lon = lon[:, np.newaxis]
+        lat = lat[:, np.newaxis]
+        azimut = azimut[:, np.newaxis]
+        if latitude is None:
+            latitude = float(np.abs(lat).max()) if lat.size else 0.
+        if template is None:
+            template = OverlayPSTemplate.default()
+        program = template.compile(tolerance, latitude)
+        self.template = template
+        self.tolerance = tolerance
+        self.latitude = latitude
+        self.count = lon.shape[0]
+        self.partKinds = program.partKinds
+        self.markLabels = program.markLabels
+        self.parts = program.parts
+        self.marksOffset = program.marksOffset
+
+        # Construct in the tangent plane at each center, with the center at
+        # the origin, or on the ellipsoid
+        if planeTolerance is None:
+            plane = None
+            x0, y0 = lon, lat
+            direct = directBatch
+        else:
+            plane = TangentPlane(lon, lat)
+            x0 = y0 = np.zeros(lon.shape)
+            direct = plane.direct
+
+        # Lists of (xs, ys) arrays of shape (count, vertices)
+        polylines = []
+        for bearing, offset, radius, arcBearings in program.rings:
+            ringX, ringY = direct(x0, y0, azimut + bearing, offset)
+            polylines.append(direct(ringX, ringY, azimut + arcBearings,
+                                    radius))
+
+        axisX, axisY = direct(x0, y0, azimut + program.axisBearings,
+                              program.axisDistances)
+        offset = 0
+        for start, end in self.parts[len(program.rings):]:
+            polylines.append((axisX[:, offset:offset + end - start],
+                              axisY[:, offset:offset + end - start]))
+            offset += end - start
+
+        # kilometer marks as (p1, point, p2) triples
+        pointX = axisX[:, offset:]
+        pointY = axisY[:, offset:]
+        markBearings = azimut + program.markBearings
+        tickX, tickY = direct(
+            np.concatenate([pointX, pointX], axis=1),
+            np.concatenate([pointY, pointY], axis=1),
+            np.concatenate([markBearings, markBearings + 180], axis=1),
+            program.markLength)
+        n = program.markCount
+        markXs = np.stack([tickX[:, :n], pointX, tickX[:, n:]],
+                          axis=2).reshape(self.count, -1)
+        markYs = np.stack([tickY[:, :n], pointY, tickY[:, n:]],
+                          axis=2).reshape(self.count, -1)
+
+        # All vertices in one (count, vertices) buffer
+        xs = np.concatenate([x for x, y in polylines] + [markXs], axis=1)
+        ys = np.concatenate([y for x, y in polylines] + [markYs], axis=1)
+
+        if plane is None:
+            self.lons, self.lats = xs, ys
+        else:
+            self.lons, self.lats = plane.toGeodetic(xs, ys)
+            # Solve the overlays outside of the error bound on the
+            # ellipsoid, with the same vertex layout
+            exact = self.planeError(program, lon, lat, azimut) > \
+                planeTolerance
+            if exact.any():
+                geometry = OverlayPSGeometry(
+                    lon[exact, 0], lat[exact, 0], azimut[exact, 0],
+                    tolerance, latitude, None, template)
+                self.lons[exact] = geometry.lons
+                self.lats[exact] = geometry.lats
+
+        # Geometries are shared with renderers on worker threads
+        self.lons.flags.writeable = False
+        self.lats.flags.writeable = False
+
+    def planeError(self, program, lon, lat, azimut):
+        """Returns the largest distance in meters of the ring ends and
+        apexes, of the axis end points and of the kilometer marks at the
+        axis ends from their geodesic solution, per overlay. The error of
+        the tangent plane construction grows with the distance from the
+        center, so this bounds the error of all vertices."""
+        # Ring centers and axis end points from the overlay center, then
+        # the ring ends and apexes and the end mark ticks from those
+        bearings = []
+        distances = []
+        sources = []
+        ends = []
+        endBearings = []
+        endDistances = []
+        indices = []
+        endIndices = []
+        for (start, end), (bearing, offset, radius, arcBearings) in zip(
+                self.parts, program.rings):
+            # The arc vertex nearest to the ring bearing is the farthest
+            # from the overlay center
+            apex = np.abs((arcBearings - bearing + 180) % 360 - 180).argmin()
+            arc = np.unique([0, apex, len(arcBearings) - 1])
+            sources.extend([len(bearings)] * len(arc))
+            bearings.append(bearing)
+            distances.append(offset)
+            endBearings.extend(arcBearings[arc])
+            endDistances.extend([radius] * len(arc))
+            endIndices.extend(start + arc)
+        for (start, end), (bearing, length, markBearing, endMark) in zip(
+                self.parts[len(program.rings):], program.axisEnds):
+            ends.append(len(bearings))
+            indices.append(end - 1)
+            if endMark is not None:
+                sources.extend([len(bearings)] * 2)
+                endBearings.extend([markBearing, markBearing + 180])
+                endDistances.extend([program.markLength] * 2)
+                offset = self.marksOffset + 3 * endMark
+                endIndices.extend([offset, offset + 2])
+            bearings.append(bearing)
+            distances.append(length)
+        pointLons, pointLats = directBatch(lon, lat, azimut + bearings,
+                                           np.array(distances))
+        endLons, endLats = directBatch(
+            pointLons[:, sources], pointLats[:, sources],
+            azimut + endBearings, np.array(endDistances))
+        exactLons = np.concatenate([pointLons[:, ends], endLons], axis=1)
+        exactLats = np.concatenate([pointLats[:, ends], endLats], axis=1)
+        indices = indices + endIndices
+        dLon = (self.lons[:, indices] - exactLons + 180) % 360 - 180
+        dx = np.radians(dLon) * np.cos(np.radians(exactLats)) * EARTH_RADIUS
+        dy = np.radians(self.lats[:, indices] - exactLats) * EARTH_RADIUS
+        return np.sqrt(dx * dx + dy * dy).max(axis=1)
+
+    def axisQuery(self, lon, lat, overlay=0):
+        """Locates positions relative to the main axes and flight lines of
+        the overlays.
+
+        :param lon: Longitudes of the positions in degrees, an array.
+        :param lat: Latitudes of the positions in degrees.
+        :param overlay: Index of the overlay each position is located
+            against, a scalar or an array.
+        :returns: Dictionary of arrays, with the index of the nearest axis
+            of the template ("axis"), the distance from the overlay center
+            along it ("along") and the signed offset, positive to the
+            right of the axis ("cross"), and the distance to it
+            ("distance"), in meters. Without axes in the template, the
+            axis is -1 and the distances are NaN.
+        """
+        lon, lat, overlay = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(lon, dtype=float)),
+            np.atleast_1d(np.asarray(lat, dtype=float)),
+            np.atleast_1d(np.asarray(overlay, dtype=np.int64)))
+        if not self.template.axes:
+            return {
+                "axis": np.full(len(lon), -1),
+                "along": np.full(len(lon), np.nan),
+                "cross": np.full(len(lon), np.nan),
+                "distance": np.full(len(lon), np.nan)
+            }
+
+        # Axis segments as (start vertex, axis index), in the tangent plane
+        # at the first vertex of each overlay
+        rings = len(self.parts) - len(self.template.axes)
+        starts = []
+        axes = []
+        for axis, (start, end) in enumerate(self.parts[rings:]):
+            starts.extend(range(start, end - 1))
+            axes.extend([axis] * (end - start - 1))
+        starts = np.array(starts)
+        axes = np.array(axes)
+        overlays, inverse = np.unique(overlay, return_inverse=True)
+        plane = TangentPlane(self.lons[overlays, :1],
+                             self.lats[overlays, :1])
+        indices = np.concatenate([starts, starts + 1])
+        vx, vy = plane.fromGeodetic(self.lons[overlays][:, indices],
+                                    self.lats[overlays][:, indices])
+        ax, ay = vx[:, :len(starts)], vy[:, :len(starts)]
+        dx = vx[:, len(starts):] - ax
+        dy = vy[:, len(starts):] - ay
+        lengthSq = dx * dx + dy * dy
+        lengthSq[lengthSq <= 0] = 1E-18
+        length = np.sqrt(lengthSq)
+        # Distance along the axis up to each segment start
+        offsets = np.cumsum(length, axis=1) - length
+        offsets -= offsets[:, np.searchsorted(axes, axes)]
+        offsets += np.array(
+            [axis["start"] for axis in self.template.axes])[axes]
+
+        # Project onto the segments of the overlay of each position at once
+        # and keep the nearest
+        plane = TangentPlane(self.lons[overlay, :1], self.lats[overlay, :1])
+        px, py = plane.fromGeodetic(lon[:, np.newaxis], lat[:, np.newaxis])
+        rx = px - ax[inverse]
+        ry = py - ay[inverse]
+        segmentDx = dx[inverse]
+        segmentDy = dy[inverse]
+        t = np.clip((rx * segmentDx + ry * segmentDy) / lengthSq[inverse],
+                    0, 1)
+        ex = rx - t * segmentDx
+        ey = ry - t * segmentDy
+        distanceSq = ex * ex + ey * ey
+        nearest = distanceSq.argmin(axis=1)
+        rows = np.arange(len(lon))
+        segments = (inverse, nearest)
+
+        along = offsets[segments] + t[rows, nearest] * length[segments]
+        cross = (dy[segments] * rx[rows, nearest] -
+                 dx[segments] * ry[rows, nearest]) / length[segments]
+        return {
+            "axis": axes[nearest],
+            "along": along,
+            "cross": cross,
+            "distance": np.sqrt(distanceSq[rows, nearest])
+        }
+
+    def withVertices(self, lons, lats):
+        """Returns a geometry with the same vertex layout and the given
+        (count, vertices) vertex arrays."""
+        geometry = copy.copy(self)
+        geometry.lons = lons
+        geometry.lats = lats
+        geometry.count = lons.shape[0]
+        geometry.lons.flags.writeable = False
+        geometry.lats.flags.writeable = False
+        return geometry
+
+    @classmethod
+    def roundTolerance(cls, tolerance):
+        """Rounds tolerance down to a power of two, so that nearby scales
+        share the same cached geometry."""
+        if tolerance is None:
+            return None
+        return 2. ** math.floor(math.log2(max(tolerance, 1E-6)))
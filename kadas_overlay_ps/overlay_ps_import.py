@@ -0,0 +1,199 @@
+import os
+
+import numpy as np
+
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import *
+from qgis.PyQt.QtWidgets import *
+from qgis.core import *
+
+from .overlay_ps_layer import OverlayPSLayer
+from .overlay_ps_transform import transformPool, transformCoords
+
+
+def openSource(path):
+    """Opens an OGR readable file as vector layer. CSV files get their
+    point geometry from the usual coordinate column names."""
+    uri = path
+    if os.path.splitext(path)[1].lower() == ".csv":
+        uri += "|option:X_POSSIBLE_NAMES=x,lon*,east*" \
+            "|option:Y_POSSIBLE_NAMES=y,lat*,north*"
+    layer = QgsVectorLayer(uri, os.path.basename(path), "ogr")
+    if not layer.crs().isValid():
+        layer.setCrs(transformPool.wgs84Crs())
+    return layer
+
+
+class OverlayPSImportTask(QgsTask):
+    """Streams point features with an azimut attribute into the overlay
+    collection of a layer.
+
+    Features are read in chunks on a worker thread, only the transformed
+    centers and azimuts are kept. The overlays are added to the collection
+    on the main thread once all features were read.
+    """
+
+    chunkSize = 1000
+
+    def __init__(self, sourceLayer, azimutField, layer):
+        QgsTask.__init__(self, "Import Overlay PS from %s" %
+                         sourceLayer.name(), QgsTask.CanCancel)
+        # Feature sources can be iterated from any thread, unlike layers
+        self.source = QgsVectorLayerFeatureSource(sourceLayer)
+        self.featureCount = sourceLayer.featureCount()
+        self.fieldIndex = sourceLayer.fields().lookupField(azimutField)
+        self.ct = transformPool.transform(sourceLayer.crs(), layer.crs())
+        self.layer = layer
+        self.chunks = []
+        self.skipped = 0
+        self.error = None
+
+    def run(self):
+        request = QgsFeatureRequest()
+        request.setSubsetOfAttributes([self.fieldIndex])
+        xs = []
+        ys = []
+        azimuts = []
+        read = 0
+        for feature in self.source.getFeatures(request):
+            if self.isCanceled():
+                return False
+            read += 1
+            azimut = feature.attribute(self.fieldIndex)
+            geometry = feature.geometry()
+            if azimut == NULL or geometry.isEmpty() or \
+                    geometry.type() != QgsWkbTypes.PointGeometry:
+                self.skipped += 1
+                continue
+            try:
+                azimut = float(azimut)
+            except (TypeError, ValueError):
+                self.skipped += 1
+                continue
+            for point in geometry.constParts():
+                xs.append(point.x())
+                ys.append(point.y())
+                azimuts.append(azimut)
+            if len(xs) >= self.chunkSize:
+                if not self.addChunk(xs, ys, azimuts):
+                    return False
+                xs, ys, azimuts = [], [], []
+            if self.featureCount > 0:
+                self.setProgress(100. * read / self.featureCount)
+        if xs:
+            return self.addChunk(xs, ys, azimuts)
+        return True
+
+    def addChunk(self, xs, ys, azimuts):
+        try:
+            xs, ys = transformCoords(self.ct, np.array(xs), np.array(ys))
+        except QgsCsException as e:
+            self.error = str(e)
+            return False
+        self.chunks.append((xs, ys, np.array(azimuts)))
+        return True
+
+    def finished(self, result):
+        if self.error:
+            QgsMessageLog.logMessage(
+                "Overlay PS import failed: %s" % self.error, "Overlay PS",
+                Qgis.Warning)
+        if self.skipped:
+            QgsMessageLog.logMessage(
+                "Overlay PS import skipped %d features without point "
+                "geometry or azimut" % self.skipped, "Overlay PS",
+                Qgis.Info)
+        if not result or not self.chunks or sip.isdeleted(self.layer):
+            return
+        collection = self.layer.overlayCollection()
+        collection.addOverlays(
+            np.concatenate([chunk[0] for chunk in self.chunks]),
+            np.concatenate([chunk[1] for chunk in self.chunks]),
+            np.concatenate([chunk[2] for chunk in self.chunks]))
+        self.chunks = []
+        self.layer.collectionChanged()
+
+
+def importOverlays(sourceLayer, azimutField, layerName, crs):
+    """Creates a collection layer, adds it to the project and imports the
+    overlays of sourceLayer into it in a background task.
+
+    :returns: The layer and the started task.
+    """
+    layer = OverlayPSLayer(layerName)
+    layer.setCrs(crs, False)
+    layer.overlayCollection()
+    QgsProject.instance().addMapLayer(layer)
+    task = OverlayPSImportTask(sourceLayer, azimutField, layer)
+    QgsApplication.taskManager().addTask(task)
+    return layer, task
+
+
+class OverlayPSImportDialog(QDialog):
+    """Selects a point layer or file and its azimut attribute."""
+
+    def __init__(self, parent=None):
+        QDialog.__init__(self, parent)
+        self.setWindowTitle(self.tr("Import Overlay PS"))
+        self.sourceLayer = None
+
+        layout = QFormLayout(self)
+        self.comboLayer = QComboBox()
+        for layer in QgsProject.instance().mapLayers().values():
+            if isinstance(layer, QgsVectorLayer) and \
+                    layer.geometryType() == QgsWkbTypes.PointGeometry:
+                self.comboLayer.addItem(layer.name(), layer.id())
+        browseButton = QPushButton(self.tr("File..."))
+        browseButton.clicked.connect(self.browse)
+        sourceLayout = QHBoxLayout()
+        sourceLayout.addWidget(self.comboLayer, 1)
+        sourceLayout.addWidget(browseButton)
+        layout.addRow(self.tr("Sites:"), sourceLayout)
+
+        self.comboField = QComboBox()
+        layout.addRow(self.tr("Azimut attribute:"), self.comboField)
+
+        self.buttonBox = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        self.buttonBox.accepted.connect(self.accept)
+        self.buttonBox.rejected.connect(self.reject)
+        layout.addRow(self.buttonBox)
+
+        self.comboLayer.currentIndexChanged.connect(self.layerChanged)
+        self.layerChanged()
+
+    def browse(self):
+        path = QFileDialog.getOpenFileName(
+            self, self.tr("Import Overlay PS"), "",
+            self.tr("Point files (*.gpkg *.csv *.shp *.geojson);;"
+                    "All files (*)"))[0]
+        if not path:
+            return
+        layer = openSource(path)
+        if not layer.isValid() or \
+                layer.geometryType() != QgsWkbTypes.PointGeometry:
+            QMessageBox.warning(self, self.tr("Import Overlay PS"),
+                                self.tr("No point features found."))
+            return
+        # Keep the file layer alive, it is not added to the project
+        self.fileLayer = layer
+        self.comboLayer.addItem(layer.name(), layer)
+        self.comboLayer.setCurrentIndex(self.comboLayer.count() - 1)
+
+    def layerChanged(self):
+        data = self.comboLayer.currentData()
+        if isinstance(data, QgsVectorLayer):
+            self.sourceLayer = data
+        else:
+            self.sourceLayer = QgsProject.instance().mapLayer(data) \
+                if data else None
+        self.comboField.clear()
+        if self.sourceLayer is not None:
+            for field in self.sourceLayer.fields():
+                if field.isNumeric():
+                    self.comboField.addItem(field.name())
+        self.buttonBox.button(QDialogButtonBox.Ok).setEnabled(
+            self.comboField.count() > 0)
+
+    def azimutField(self):
+        return self.comboField.currentText()
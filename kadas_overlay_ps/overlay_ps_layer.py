@@ -1,5 +1,10 @@
+import functools
 import math
-from geographiclib.geodesic import Geodesic
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
 
 from qgis.PyQt.QtCore import *
 from qgis.PyQt.QtGui import *
@@ -8,20 +13,155 @@ from qgis.core import *
 from qgis.gui import *
 from kadas.kadascore import *
 
+from .overlay_ps_collection import OverlayPSCollection
+from .overlay_ps_geometry import MAX_CHORD_ERROR, OverlayPSGeometry
+from .overlay_ps_locator import OverlayPSLocator
+from .overlay_ps_template import OverlayPSTemplate
+from .overlay_ps_profiler import OverlayPSRenderStats, \
+    OverlayPSStageProfiler, profilingEnabled
+from .overlay_ps_transform import transformPool, transformCoords, \
+    mapToPixelCoords, polygonFromArrays
+
+# Shared by all layers, threads are only started once jobs are submitted
+geometryExecutor = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 2) - 1),
+    thread_name_prefix="OverlayPSGeometry")
+
+
+def computeGeometry(profiler, lon, lat, azimut, tolerance, template):
+    with profiler.stage("geometry"):
+        return OverlayPSGeometry(lon, lat, azimut, tolerance,
+                                 template=template)
+
+
+def geometryExtent(geometry, ct):
+    """Returns the bounding box of a geometry transformed with ct."""
+    xs, ys = transformCoords(ct, geometry.lons, geometry.lats)
+    return QgsRectangle(float(xs.min()), float(ys.min()),
+                        float(xs.max()), float(ys.max()))
+
+
+class OverlayPSGeometryCache:
+    """Geographic geometry of a single overlay per chord tolerance, shared
+    by a layer on the main thread and its renderers on worker threads.
+
+    Entries are computed geometries, or futures of geometries being
+    computed on the geometry thread pool or by another caller. Futures
+    are waited for, so that no geometry is computed twice. The cache
+    stores the geometry of one set of layer parameters, its key. Geometry
+    of other keys is computed but not stored.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.key = None
+        self.entries = {}
+        self.extentCache = None
+
+    def reset(self, key):
+        """Drops all geometry and cancels the queued jobs, and keys the
+        cache to key."""
+        with self.lock:
+            # Running jobs can not be cancelled, their result is ignored
+            for entry in self.entries.values():
+                if isinstance(entry, Future):
+                    entry.cancel()
+            self.key = key
+            self.entries = {}
+            self.extentCache = None
+
+    def submit(self, key, tolerance, profiler, lon, lat, azimut, template):
+        """Starts computing the geometry for tolerance on the geometry
+        thread pool, unless it is computed or pending already."""
+        with self.lock:
+            if key != self.key or tolerance in self.entries:
+                return
+            try:
+                future = geometryExecutor.submit(
+                    computeGeometry, profiler, lon, lat, azimut, tolerance,
+                    template)
+            except RuntimeError:
+                # Shut down on plugin unload, render computes it instead
+                return
+            self.entries[tolerance] = future
+
+    def geometry(self, key, tolerance, profiler, lon, lat, azimut,
+                 template):
+        """Returns the geometry for tolerance, from the cache, waiting for
+        its computation if it is running, or computing it."""
+        with self.lock:
+            entry = self.entries.get(tolerance) if key == self.key else None
+            if isinstance(entry, Future) and entry.cancel():
+                # Still queued behind other jobs, compute it right away
+                entry = None
+            if entry is None:
+                future = Future()
+                future.set_running_or_notify_cancel()
+                if key == self.key:
+                    self.entries[tolerance] = future
+        if entry is None:
+            try:
+                geometry = computeGeometry(profiler, lon, lat, azimut,
+                                           tolerance, template)
+            except Exception as e:
+                future.set_exception(e)
+                with self.lock:
+                    if self.entries.get(tolerance) is future:
+                        del self.entries[tolerance]
+                raise
+            future.set_result(geometry)
+        elif isinstance(entry, Future):
+            geometry = entry.result()
+        else:
+            return entry
+        with self.lock:
+            if key == self.key and \
+                    isinstance(self.entries.get(tolerance), Future):
+                self.entries[tolerance] = geometry
+        return geometry
+
+    def extent(self, key, ct, profiler, lon, lat, azimut, template):
+        """Returns the bounding box of the full resolution geometry
+        transformed with ct."""
+        with self.lock:
+            extent = self.extentCache if key == self.key else None
+        if extent is None:
+            extent = geometryExtent(
+                self.geometry(key, None, profiler, lon, lat, azimut,
+                              template), ct)
+            with self.lock:
+                if key == self.key:
+                    self.extentCache = extent
+        return QgsRectangle(extent)
+
 
 class OverlayPSLayer(KadasPluginLayer):
 
+    # Number of overlay locators kept in collection mode
+    maxLocators = 256
+    # Chord tolerance in meters of the axes positions are located against
+    queryTolerance = 0.5
+
     def __init__(self, layer_name):
         KadasPluginLayer.__init__(self, self.layerType(), layer_name)
 
         self.setValid(True)
         self.center = QgsPointXY()
         self.azimut = 202.5
+        self.template = OverlayPSTemplate.default()
         self.color = Qt.black
         self.lineWidth = 3
         self.fontSize = 10
         self.transparency = 0
         self.layer_name = layer_name
+        self.geometryCache = OverlayPSGeometryCache()
+        self.lastTolerance = None
+        self.pictureCache = OverlayPSPictureCache()
+        self.labelCache = OverlayPSLabelCache()
+        self.renderStats = OverlayPSRenderStats()
+        self.collection = None
+        self.locatorCache = OrderedDict()
+        self.locatorCacheKey = None
 
     @classmethod
     def layerType(self):
@@ -31,21 +171,224 @@ class OverlayPSLayer(KadasPluginLayer):
         return "overlayps"
 
     def setup(self, center, crs, azimut):
+        changed = center != self.center or azimut != self.azimut or \
+            crs != self.crs()
         self.center = center
         self.azimut = azimut
 
         self.setCrs(crs, False)
+        if changed:
+            self.invalidateGeometry()
+            self.precomputeGeometry()
+
+    def invalidateGeometry(self):
+        self.geometryCache.reset(None)
+        self.locatorCache = OrderedDict()
+        self.pictureCache.clear()
+
+    def setTemplate(self, template):
+        if template.key != self.template.key:
+            self.template = template
+            self.invalidateGeometry()
+            self.precomputeGeometry()
+
+    def getTemplate(self):
+        return self.template
+
+    def geometryKey(self):
+        return (self.center.x(), self.center.y(), self.azimut,
+                self.crs().authid(), self.template.key,
+                transformPool.revision)
+
+    def syncGeometryCache(self):
+        """Rekeys the geometry cache if center, azimut, crs or template
+        changed since the geometry was last computed.
+
+        :returns: The current geometry key.
+        """
+        key = self.geometryKey()
+        if self.geometryCache.key != key:
+            self.geometryCache.reset(key)
+        return key
+
+    def geometryArgs(self):
+        """Returns the (lon, lat, azimut, template) the overlay geometry
+        is computed from."""
+        wgsCenter = transformPool.toWgs84(self.crs()).transform(self.center)
+        return wgsCenter.x(), wgsCenter.y(), self.azimut, self.template
+
+    def precomputeGeometry(self):
+        """Starts computing the overlay geometry on the geometry thread
+        pool, at full resolution for the extent and at the tolerance of the
+        last render. Jobs of previous parameters are cancelled."""
+        if self.collection is not None:
+            return
+        key = self.syncGeometryCache()
+        profiler = OverlayPSStageProfiler(self.renderStats,
+                                          profilingEnabled(), "geometry")
+        for tolerance in {None, self.lastTolerance}:
+            self.geometryCache.submit(key, tolerance, profiler,
+                                      *self.geometryArgs())
+
+    def overlayGeometry(self, tolerance=None):
+        """Returns the cached geographic overlay geometry, computing it if
+        center, azimut or crs changed since it was last computed.
+
+        :param tolerance: Maximum chord error in meters, see
+            OverlayPSGeometry. It is rounded down to a power of two so that
+            nearby scales share the same cached geometry.
+        """
+        key = self.syncGeometryCache()
+        profiler = OverlayPSStageProfiler(self.renderStats,
+                                          profilingEnabled())
+        return self.geometryCache.geometry(
+            key, OverlayPSGeometry.roundTolerance(tolerance), profiler,
+            *self.geometryArgs())
+
+    def isCollection(self):
+        return self.collection is not None
+
+    def overlayCollection(self):
+        """Returns the overlays of the layer in collection mode, switching
+        the layer to collection mode if needed.
+
+        Call collectionChanged() after modifying the collection."""
+        if self.collection is None:
+            self.collection = OverlayPSCollection()
+        return self.collection
+
+    def collectionChanged(self):
+        self.pictureCache.clear()
+        self.locatorCache = OrderedDict()
+        self.triggerRepaint()
+
+    def overlayLocators(self, rect):
+        """Returns the locators of the overlays intersecting rect in layer
+        crs, building them on first use. The maxLocators most recently
+        used are kept until the overlays change."""
+        if self.collection is None:
+            key = self.geometryKey()
+            rows = [0]
+        else:
+            prepared = self.collection.prepare(self.crs(), self.template)
+            key = prepared.key
+            rows = [int(row) for row in prepared.visible(rect)]
+        if key != self.locatorCacheKey:
+            self.locatorCache = OrderedDict()
+            self.locatorCacheKey = key
+        missing = [row for row in rows if row not in self.locatorCache]
+        if missing:
+            if self.collection is None:
+                geometry = self.overlayGeometry()
+            else:
+                geometry = prepared.geometry(np.array(missing), None)
+            xs, ys = transformCoords(transformPool.fromWgs84(self.crs()),
+                                     geometry.lons, geometry.lats)
+            for idx, row in enumerate(missing):
+                self.locatorCache[row] = OverlayPSLocator(geometry, idx, xs,
+                                                          ys, row)
+        locators = []
+        for row in rows:
+            self.locatorCache.move_to_end(row)
+            locators.append(self.locatorCache[row])
+        while len(self.locatorCache) > self.maxLocators:
+            self.locatorCache.popitem(last=False)
+        return locators
+
+    def snapPoint(self, point, tolerance, vertices=True, segments=True):
+        """Snaps a point in layer crs to the overlay geometry. Ring and
+        axis ends and kilometer marks take precedence over the nearest
+        point on a line.
+
+        :param tolerance: Search radius in layer map units.
+        :returns: Tuple of the snapped point and a dictionary describing
+            the overlay element, see OverlayPSLocator, or None.
+        """
+        locators = self.overlayLocators(QgsRectangle(
+            point.x() - tolerance, point.y() - tolerance,
+            point.x() + tolerance, point.y() + tolerance))
+        for enabled, snap in ((vertices, OverlayPSLocator.snapToPoint),
+                              (segments, OverlayPSLocator.snapToSegment)):
+            if not enabled:
+                continue
+            matches = [match for match in (
+                snap(locator, point, tolerance) for locator in locators)
+                if match]
+            if matches:
+                distance, snapped, info = min(matches,
+                                              key=lambda match: match[0])
+                return snapped, info
+        return None
+
+    def identify(self, point, tolerance):
+        """Returns the dictionary describing the overlay element nearest
+        to point within tolerance, in layer crs and map units, or None."""
+        match = self.snapPoint(point, tolerance, vertices=False)
+        return match[1] if match else None
+
+    def queryPositions(self, xs, ys, crs=None):
+        """Locates positions relative to the main axes and flight lines of
+        the overlay, or of the overlay with the nearest axis in collection
+        mode, see OverlayPSGeometry.axisQuery(). The kilometer mark of a
+        position is its "along" distance divided by 1000.
+
+        :param xs: Array of x coordinates of the positions.
+        :param ys: Array of y coordinates of the positions.
+        :param crs: Crs of the positions, defaults to the layer crs.
+        :returns: Dictionary of arrays as returned by axisQuery(), with
+            the index of the overlay of each position ("overlay").
+        """
+        crs = crs or self.crs()
+        xs = np.atleast_1d(np.asarray(xs, dtype=float))
+        ys = np.atleast_1d(np.asarray(ys, dtype=float))
+        lons, lats = transformCoords(transformPool.toWgs84(crs), xs, ys)
+        if self.collection is None:
+            result = self.overlayGeometry(self.queryTolerance).axisQuery(
+                lons, lats)
+            result["overlay"] = np.zeros(len(xs), dtype=np.int64)
+            return result
+        if not self.collection.count() or not len(xs):
+            return {
+                "axis": np.full(len(xs), -1),
+                "along": np.full(len(xs), np.nan),
+                "cross": np.full(len(xs), np.nan),
+                "distance": np.full(len(xs), np.nan),
+                "overlay": np.full(len(xs), -1)
+            }
+        prepared = self.collection.prepare(self.crs(), self.template)
+        layerXs, layerYs = transformCoords(
+            transformPool.transform(crs, self.crs()), xs, ys)
+        positions, rows = prepared.candidates(layerXs, layerYs)
+        overlays, inverse = np.unique(rows, return_inverse=True)
+        result = prepared.geometry(overlays, self.queryTolerance).axisQuery(
+            lons[positions], lats[positions], inverse)
+        result["overlay"] = rows
+
+        # Keep the overlay with the nearest axis of each position
+        order = np.lexsort((result["distance"], positions))
+        first = order[np.concatenate(
+            [[True], positions[order][1:] != positions[order][:-1]])]
+        return {name: values[first] for name, values in result.items()}
+
+    def renderStatistics(self):
+        """Returns per-stage render timings of the recent renders, recorded
+        while the kadas_overlay_ps/profiling setting is enabled."""
+        return self.renderStats.summary()
 
     def createMapRenderer(self, rendererContext):
         return Renderer(self, rendererContext)
 
     def extent(self):
-        radius = 230
-        radius *= QgsUnitTypes.fromUnitToUnitFactor(
-            QgsUnitTypes.DistanceMeters, self.crs().mapUnits())
-
-        return QgsRectangle(self.center.x() - radius, self.center.y() - radius,
-                            self.center.x() + radius, self.center.y() + radius)
+        """Returns the bounding box of all rendered lines and kilometer
+        marks in layer crs."""
+        if self.collection is not None:
+            return self.collection.prepare(self.crs(),
+                                           self.template).extent()
+        profiler = OverlayPSStageProfiler(self.renderStats,
+                                          profilingEnabled())
+        return self.geometryCache.extent(
+            self.syncGeometryCache(), transformPool.fromWgs84(self.crs()),
+            profiler, *self.geometryArgs())
 
     def azimutToRadiant(self, azimut):
         return (azimut / 180) * math.pi
@@ -89,6 +432,22 @@ class OverlayPSLayer(KadasPluginLayer):
         self.fontSize = int(layerEl.attribute("fontSize"))
 
         self.setCrs(QgsCoordinateReferenceSystem(layerEl.attribute("crs")))
+        templateEl = layerEl.firstChildElement("template")
+        self.template = OverlayPSTemplate.default()
+        if not templateEl.isNull():
+            try:
+                self.template = OverlayPSTemplate.readXml(templateEl)
+            except ValueError as e:
+                QgsMessageLog.logMessage(
+                    "Invalid overlay template: %s" % e, "Overlay PS",
+                    Qgis.Warning)
+        overlaysEl = layerEl.firstChildElement("overlays")
+        if overlaysEl.isNull():
+            self.collection = None
+        else:
+            self.overlayCollection().readXml(overlaysEl)
+        self.invalidateGeometry()
+        self.precomputeGeometry()
         return True
 
     def writeXml(self, layer_node, document, context):
@@ -105,182 +464,439 @@ class OverlayPSLayer(KadasPluginLayer):
             self.color))
         layerEl.setAttribute("lineWidth", self.getLineWidth())
         layerEl.setAttribute("fontSize", self.getFontSize())
+        if not self.template.isDefault():
+            templateEl = document.createElement("template")
+            self.template.writeXml(templateEl, document)
+            layerEl.appendChild(templateEl)
+        if self.collection is not None:
+            overlaysEl = document.createElement("overlays")
+            self.collection.writeXml(overlaysEl, document)
+            layerEl.appendChild(overlaysEl)
         return True
 
 
+class OverlayPSPainter:
+    """Draws the overlays of a geometry from their (count, vertices)
+    vertex arrays in device pixels, with one path per stage."""
+
+    stageNames = ["ring", "mainAxis", "flightLine", "marks", "labels"]
+
+    def __init__(self, geometry, px, py, labelCache, visible=None):
+        """:param px: Device x coordinates of the first vertices of the
+            geometry, at least vertexEnd(geometry, visible) of them.
+        :param visible: Names of the stages to draw, defaults to all."""
+        self.geometry = geometry
+        self.px = px
+        self.py = py
+        self.labelCache = labelCache
+        self.visible = set(self.stageNames if visible is None else visible)
+        offset = geometry.marksOffset
+        self.markX = px[:, offset:].reshape(geometry.count, -1, 3)
+        self.markY = py[:, offset:].reshape(geometry.count, -1, 3)
+
+    @staticmethod
+    def setupPainter(painter, color, lineWidth, fontSize, transparency):
+        """Applies the overlay style to painter."""
+        painter.setOpacity((100. - transparency) / 100.)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.setPen(QPen(color, lineWidth))
+        font = painter.font()
+        font.setPixelSize(fontSize)
+        painter.setFont(font)
+
+    @classmethod
+    def visibleStages(cls, pixelsPerKm, fontSize, template):
+        """Returns the names of the stages drawn at the given scale."""
+        thresholds = template.visibilityThresholds(fontSize)
+        return [name for name in cls.stageNames
+                if pixelsPerKm >= thresholds.get(name, 0)]
+
+    @staticmethod
+    def vertexEnd(geometry, visible):
+        """Returns the number of leading vertices of each overlay needed
+        to draw the visible stages."""
+        if "marks" in visible or "labels" in visible:
+            return geometry.lons.shape[1]
+        end = 0
+        for (start, stop), kind in zip(geometry.parts, geometry.partKinds):
+            if kind in visible:
+                end = stop
+        return end
+
+    def stages(self, painter):
+        """Returns the visible drawing stages in painting order, as
+        (name, vertex or label count, callable) tuples."""
+        labelCount = self.geometry.count * len(
+            [label for label in self.geometry.markLabels if label])
+        stages = [
+            ("ring", self.vertexCount("ring"),
+             lambda: self.drawParts(painter, "ring")),
+            ("mainAxis", self.vertexCount("mainAxis"),
+             lambda: self.drawParts(painter, "mainAxis")),
+            ("flightLine", self.vertexCount("flightLine"),
+             lambda: self.drawParts(painter, "flightLine")),
+            ("marks", self.markX.size,
+             lambda: self.drawAxisMarks(painter)),
+            ("labels", labelCount,
+             lambda: self.drawLabels(painter))
+        ]
+        return [stage for stage in stages if stage[0] in self.visible]
+
+    def draw(self, painter):
+        for name, count, stage in self.stages(painter):
+            stage()
+
+    def vertexCount(self, kind):
+        return self.geometry.count * sum(
+            end - start for (start, end), partKind in zip(
+                self.geometry.parts, self.geometry.partKinds)
+            if partKind == kind)
+
+    def drawParts(self, painter, kind):
+        # draw ring, main axis or flight lines
+        parts = [(start, end) for (start, end), partKind in zip(
+            self.geometry.parts, self.geometry.partKinds) if partKind == kind]
+        path = QPainterPath()
+        for px, py in zip(self.px, self.py):
+            for start, end in parts:
+                path.addPolygon(polygonFromArrays(px[start:end],
+                                                  py[start:end]))
+        painter.drawPath(path)
+
+    def drawAxisMarks(self, painter):
+        # draw kilometer marks
+        path = QPainterPath()
+        for markX, markY in zip(self.markX, self.markY):
+            for xs, ys in zip(markX, markY):
+                path.addPolygon(polygonFromArrays(xs, ys))
+        painter.drawPath(path)
+
+    def drawLabels(self, painter):
+        # draw kilometer mark labels, as glyph outlines in one path
+        labels = [label for label in self.geometry.markLabels if label]
+        outlines = self.labelCache.get(painter.font(), labels)
+        dx = self.markX[:, :, 0] - self.markX[:, :, 2]
+        dy = self.markY[:, :, 0] - self.markY[:, :, 2]
+        l = np.sqrt(dx * dx + dy * dy)
+        l[l <= 1E-6] = 1
+        dx /= l
+        dy /= l
+        path = QPainterPath()
+        for markX, markY, ux, uy in zip(self.markX, self.markY, dx, dy):
+            for idx, label in enumerate(self.geometry.markLabels):
+                if not label:
+                    continue
+                outline, w = outlines[label]
+                path.addPath(outline.translated(
+                    markX[idx, 2] - ux[idx] * 2 * w,
+                    markY[idx, 2] - uy[idx] * 2 * w))
+        painter.fillPath(path, painter.pen().color())
+
+
 class Renderer(QgsMapLayerRenderer):
+
+    maxChordError = MAX_CHORD_ERROR
+
     def __init__(self, layer, rendererContext):
         QgsMapLayerRenderer.__init__(self, layer.id())
 
-        # Constants
-        self.ringRadius = 1750  # meters
-        self.mainAxisLength = 7000  # meters
-        self.flightLineLength = 6000  # meters
-
-        self.layer = layer
+        # Snapshot the layer state here, on the main thread, render() must
+        # not touch the layer nor the project as it runs on a worker thread.
+        # Only the geometry inputs are taken, the geometry itself is built
+        # in render() unless it is cached already.
         self.rendererContext = rendererContext
-        self.geod = Geodesic.WGS84
-        self.mDa = QgsDistanceArea()
-
-        self.mDa.setEllipsoid("WGS84")
-        self.mDa.setSourceCrs(QgsCoordinateReferenceSystem("EPSG:4326"),
-                              QgsProject.instance().transformContext())
-
-    def drawAxisMarks(self, rct, metrics, marks, axisbearing, flip):
-        # draw kilometer marks
+        tolerance = OverlayPSGeometry.roundTolerance(
+            self.chordTolerance(layer))
+        self.rct = self.geographicTransform(layer)
+        self.pictureCache = layer.pictureCache
+        self.labelCache = layer.labelCache
+        self.transparency = layer.transparency
+        self.pixelsPerKm = 1000. / max(self.metersPerPixel(layer.crs()),
+                                       1E-9)
+        self.profiler = OverlayPSStageProfiler(layer.renderStats,
+                                               profilingEnabled())
+        self.mFeedback = QgsFeedback()
+
+        # List of (color, lineWidth, fontSize, geometry source) groups,
+        # drawn with one path per stage each. Sources are callables
+        # returning the geometry of the group.
+        layerStyle = (QColor(layer.getColor()), layer.getLineWidth(),
+                      layer.getFontSize())
+        if layer.isCollection():
+            self.sources, self.contentKey = self.collectionGroups(
+                layer.collection, layer.crs(), layer.template, layerStyle,
+                tolerance)
+            self.extentSource = layer.collection.prepare(
+                layer.crs(), layer.template).extent
+        else:
+            layer.lastTolerance = tolerance
+            key = layer.syncGeometryCache()
+            args = (self.profiler,) + layer.geometryArgs()
+            self.sources = [layerStyle + (functools.partial(
+                layer.geometryCache.geometry, key, tolerance, *args),)]
+            self.extentSource = functools.partial(
+                layer.geometryCache.extent, key,
+                transformPool.fromWgs84(layer.crs()), *args)
+            self.contentKey = key
+        self.groups = None
+        self.tolerance = tolerance
+        self.margin = self.labelMargin(
+            max([group[2] for group in self.sources] or [0]), layer.crs())
+
+    def geographicTransform(self, layer):
+        """Returns the transform from the geographic overlay vertices
+        directly to the destination crs of the map."""
+        ct = self.rendererContext.coordinateTransform()
+        if not ct.isValid():
+            return transformPool.fromWgs84(layer.crs())
+        if transformPool.crsKey(ct.sourceCrs()) == \
+                transformPool.crsKey(transformPool.wgs84Crs()):
+            # the layer is geographic, reuse the render context transform
+            return QgsCoordinateTransform(ct)
+        return transformPool.fromWgs84(ct.destinationCrs())
+
+    def collectionGroups(self, collection, crs, template, layerStyle,
+                         tolerance):
+        """Returns the style groups of the visible overlays of a collection
+        and a key identifying them."""
+        prepared = collection.prepare(crs, template)
+        fontSize = max([style[2] for style in collection.styles] +
+                       [layerStyle[2]])
+        margin = self.labelMargin(fontSize, crs)
+        rows = prepared.visible(
+            self.rendererContext.extent().buffered(margin))
+        groups = []
+        styleIndices = prepared.styleIndices[rows]
+        for styleIndex in np.unique(styleIndices):
+            if styleIndex < len(collection.styles):
+                color, lineWidth, fontSize = collection.styles[styleIndex]
+                style = (QColor(color), lineWidth, fontSize)
+            else:
+                style = layerStyle
+            groups.append(style + (functools.partial(
+                prepared.geometry, rows[styleIndices == styleIndex],
+                tolerance),))
+        return groups, (prepared.key, hash(rows.tobytes()))
+
+    def overlayGroups(self):
+        """Returns the style groups with their geometry, building the
+        geometry not cached yet."""
+        if self.groups is None:
+            self.groups = [(color, lineWidth, fontSize, source())
+                           for color, lineWidth, fontSize, source
+                           in self.sources]
+        return self.groups
+
+    def metersPerPixel(self, layerCrs):
+        ct = self.rendererContext.coordinateTransform()
+        crs = ct.destinationCrs() if ct.isValid() else layerCrs
+        return self.rendererContext.mapToPixel().mapUnitsPerPixel() * \
+            QgsUnitTypes.fromUnitToUnitFactor(crs.mapUnits(),
+                                              QgsUnitTypes.DistanceMeters)
+
+    def labelMargin(self, fontSize, crs):
+        """Returns the distance labels extend beyond the kilometer marks
+        in units of the layer crs, the crs of the render extent."""
+        return 4 * fontSize * self.metersPerPixel(crs) * \
+            QgsUnitTypes.fromUnitToUnitFactor(QgsUnitTypes.DistanceMeters,
+                                              crs.mapUnits())
+
+    def chordTolerance(self, layer):
+        """Returns the maximum chord error in meters at the render scale."""
+        return self.maxChordError * self.metersPerPixel(layer.crs())
+
+    def pictureTag(self):
+        """Returns everything but the map position a rendered frame
+        depends on."""
         mapToPixel = self.rendererContext.mapToPixel()
-        font = self.rendererContext.painter().font()
-        font.setBold(True)
-        self.rendererContext.painter().setFont(font)
-        for idx, mark in enumerate(marks):
-            point, label = mark
-            s = -1 if flip else 1
-            p1 = self.mDa.computeSpheroidProject(
-                point, 250, axisbearing + self.layer.azimutToRadiant(90 * s))
-            p2 = self.mDa.computeSpheroidProject(
-                point, 250, axisbearing + self.layer.azimutToRadiant(270 * s))
-            poly = QPolygonF()
-            poly.append(mapToPixel.transform(rct.transform(p1)).toQPointF())
-            poly.append(mapToPixel.transform(rct.transform(point)).toQPointF())
-            poly.append(mapToPixel.transform(rct.transform(p2)).toQPointF())
-            path = QPainterPath()
-            path.addPolygon(poly)
-            self.rendererContext.painter().drawPath(path)
-
-            # draw label
-            if not label:
-                continue
-            dx = poly[0].x() - poly[2].x()
-            dy = poly[0].y() - poly[2].y()
-            l = math.sqrt(dx * dx + dy * dy)
-            if l > 1E-6:
-                dx /= l
-                dy /= l
-            w = metrics.width(label)
-            h = self.rendererContext.painter().font().pixelSize()
-            cx = poly[2].x() - dx * 2 * w
-            cy = poly[2].y() - dy * 2 * w
-            self.rendererContext.painter().drawText(
-                cx - 0.5 * w, cy - 0.5 * h, w, h,
-                Qt.AlignCenter | Qt.AlignHCenter, label
-            )
-        font.setBold(False)
-        self.rendererContext.painter().setFont(font)
+        painter = self.rendererContext.painter()
+        return (self.contentKey, self.tolerance,
+                transformPool.crsKey(self.rct.destinationCrs()),
+                mapToPixel.mapUnitsPerPixel(), mapToPixel.mapRotation(),
+                self.rendererContext.scaleFactor(),
+                painter.device().devicePixelRatioF(),
+                int(painter.renderHints()), painter.font().toString(),
+                tuple((color.rgba(), lineWidth, fontSize)
+                      for color, lineWidth, fontSize, source
+                      in self.sources),
+                self.transparency)
+
+    def feedback(self):
+        return self.mFeedback
+
+    def isStopped(self):
+        return self.rendererContext.renderingStopped() or \
+            self.mFeedback.isCanceled()
+
+    def drawOverlay(self, painter):
+        """Draws the overlay in stages, checking for cancellation in
+        between.
+
+        :returns: False if rendering was stopped before completion.
+        """
+        groups = self.overlayGroups()
+        # skip the elements too small to read at this scale, and their
+        # vertices
+        visible = [OverlayPSPainter.visibleStages(self.pixelsPerKm, fontSize,
+                                                  geometry.template)
+                   for color, lineWidth, fontSize, geometry in groups]
+        ends = [OverlayPSPainter.vertexEnd(group[3], groupVisible)
+                for group, groupVisible in zip(groups, visible)]
+
+        # transform the vertices of all groups at once
+        lons = np.concatenate([group[3].lons[:, :end].ravel()
+                               for group, end in zip(groups, ends)])
+        lats = np.concatenate([group[3].lats[:, :end].ravel()
+                               for group, end in zip(groups, ends)])
+        with self.profiler.stage("transform", len(lons)):
+            xs, ys = transformCoords(self.rct, lons, lats)
+            px, py = mapToPixelCoords(self.rendererContext.mapToPixel(),
+                                      xs, ys)
+
+        offset = 0
+        stageCount = sum(len(groupVisible) for groupVisible in visible)
+        done = 0
+        for (color, lineWidth, fontSize, geometry), groupVisible, end in \
+                zip(groups, visible, ends):
+            shape = (geometry.count, end)
+            size = geometry.count * end
+            groupX = px[offset:offset + size].reshape(shape)
+            groupY = py[offset:offset + size].reshape(shape)
+            offset += size
+
+            OverlayPSPainter.setupPainter(
+                painter, color, lineWidth, fontSize, self.transparency)
+            stages = OverlayPSPainter(geometry, groupX, groupY,
+                                      self.labelCache,
+                                      groupVisible).stages(painter)
+            for name, count, stage in stages:
+                if self.isStopped():
+                    return False
+                with self.profiler.stage(name, count):
+                    stage()
+                done += 1
+                self.mFeedback.setProgress(100. * done / stageCount)
+        return True
 
     def render(self):
-        azimut = self.layer.getAzimut(True)
+        if self.isStopped():
+            return False
+        if not self.sources:
+            return True
+        extent = self.extentSource()
+        if self.isStopped():
+            return False
+
+        # skip overlays entirely outside of the visible extent, allowing
+        # for labels drawn beyond the kilometer marks
+        if not self.rendererContext.extent().intersects(
+                extent.buffered(self.margin)):
+            return True
+
+        painter = self.rendererContext.painter()
+        # pixel position of a point fixed on the map, in destination crs
+        center = extent.center()
+        ct = self.rendererContext.coordinateTransform()
+        if ct.isValid() and not ct.isShortCircuited():
+            try:
+                center = ct.transform(center)
+            except QgsCsException:
+                pass
+        anchor = self.rendererContext.mapToPixel().transform(
+            center).toQPointF()
+        tag = self.pictureTag()
+
+        # replay the last frame if only the map position changed
+        cached = self.pictureCache.get(tag)
+        if cached is not None:
+            picture, origin = cached
+            with self.profiler.stage("replay"):
+                painter.save()
+                painter.translate(anchor - origin)
+                painter.drawPicture(0, 0, picture)
+                painter.restore()
+            return True
+
+        picture = QPicture()
+        picturePainter = QPainter(picture)
+        picturePainter.setRenderHints(painter.renderHints())
+        picturePainter.setFont(painter.font())
+        completed = self.drawOverlay(picturePainter)
+        picturePainter.end()
+        if not completed:
+            # drop the stale frame
+            return False
+
+        painter.save()
+        painter.drawPicture(0, 0, picture)
+        painter.restore()
+        self.pictureCache.set(tag, picture, anchor)
+        return True
 
-        mapToPixel = self.rendererContext.mapToPixel()
-        self.rendererContext.painter().save()
-        self.rendererContext.painter().setOpacity((
-            100. - self.layer.transparency) / 100.)
-        self.rendererContext.painter().setCompositionMode(
-            QPainter.CompositionMode_Source)
-        self.rendererContext.painter().setPen(
-            QPen(self.layer.color, self.layer.lineWidth))
-        font = self.rendererContext.painter().font()
-        font.setPixelSize(self.layer.getFontSize())
-        self.rendererContext.painter().setFont(font)
-        metrics = QFontMetrics(font)
-
-        ct = QgsCoordinateTransform(self.layer.crs(),
-                                    QgsCoordinateReferenceSystem("EPSG:4326"),
-                                    QgsProject.instance())
-        rct = QgsCoordinateTransform(QgsCoordinateReferenceSystem("EPSG:4326"),
-                                     self.layer.crs(),
-                                     QgsProject.instance())
-
-        # draw rings
-        wgsCenter = ct.transform(self.layer.center)
-        point = self.mDa.computeSpheroidProject(
-            wgsCenter, self.ringRadius, azimut + self.layer.azimutToRadiant(
-                90))
-        line = self.geod.InverseLine(wgsCenter.y(), wgsCenter.x(),
-                                     point.y(), point.x())
-        newCenter = QgsPointXY(line.Position(1750)["lon2"],
-                               line.Position(1750)["lat2"])
-        poly = QPolygonF()
-        for a in range(-150, 151):
-            wgsPoint = self.mDa.computeSpheroidProject(
-                newCenter, self.ringRadius,
-                self.layer.azimutToRadiant(
-                    a) + azimut + self.layer.azimutToRadiant(90))
-            mapPoint = rct.transform(wgsPoint)
-            poly.append(mapToPixel.transform(mapPoint).toQPointF())
 
-        path = QPainterPath()
-        path.addPolygon(poly)
-        self.rendererContext.painter().drawPath(path)
-
-        # draw main axis
-        for bearing, flip in [(azimut, False), (
-                azimut + self.layer.azimutToRadiant(180), True)]:
-            marks = []
-            wgsPoint = self.mDa.computeSpheroidProject(
-                wgsCenter, self.mainAxisLength, bearing)
-            line = self.geod.InverseLine(wgsCenter.y(), wgsCenter.x(),
-                                         wgsPoint.y(), wgsPoint.x())
-            sdist = 1000
-            nSegments = max(1, int(math.ceil(self.mainAxisLength / sdist)))
-            poly = QPolygonF()
-            for iseg in range(nSegments + 1):
-                coords = line.Position(iseg * sdist)
-                marks.append((
-                    QgsPointXY(coords["lon2"], coords["lat2"]),
-                    "%s" % iseg if iseg > 0 else None
-                ))
-                mapPoint = rct.transform(
-                    QgsPointXY(coords["lon2"], coords["lat2"]))
-                poly.append(mapToPixel.transform(mapPoint).toQPointF())
-            line.Position(self.mainAxisLength)
-
-            mapPoint = rct.transform(
-                QgsPointXY(coords["lon2"], coords["lat2"]))
-            poly.append(mapToPixel.transform(mapPoint).toQPointF())
-            path = QPainterPath()
-            path.addPolygon(poly)
-            self.rendererContext.painter().drawPath(path)
-
-            self.drawAxisMarks(rct, metrics, marks, bearing, flip)
-
-        # draw flight lines
-        for bearing, flip in [
-                (azimut + self.layer.azimutToRadiant(45), False),
-                (azimut + self.layer.azimutToRadiant(90), False),
-                (azimut + self.layer.azimutToRadiant(135), True)]:
-            marks = []
-            wgsPoint = self.mDa.computeSpheroidProject(
-                wgsCenter, self.flightLineLength, bearing)
-            line = self.geod.InverseLine(wgsCenter.y(), wgsCenter.x(),
-                                         wgsPoint.y(), wgsPoint.x())
-            sdist = 500
-            nSegments = max(1, int(math.ceil(self.flightLineLength / sdist)))
-            poly = QPolygonF()
-            for iseg in range(nSegments + 1):
-                if iseg in range(3):
-                    continue
-                coords = line.Position(iseg * sdist)
-                if iseg > 3 and iseg % 2 == 0:
-                    marks.append((
-                        QgsPointXY(coords["lon2"], coords["lat2"]),
-                        "%d" % (iseg / 2)
-                    ))
-                mapPoint = rct.transform(
-                    QgsPointXY(coords["lon2"], coords["lat2"]))
-                poly.append(mapToPixel.transform(mapPoint).toQPointF())
-
-            line.Position(self.flightLineLength)
-            mapPoint = rct.transform(
-                QgsPointXY(coords["lon2"], coords["lat2"]))
-            poly.append(mapToPixel.transform(mapPoint).toQPointF())
-            path = QPainterPath()
-            path.addPolygon(poly)
-            self.rendererContext.painter().drawPath(path)
-
-            self.drawAxisMarks(rct, metrics, marks, bearing, flip)
-
-        self.rendererContext.painter().restore()
-        return True
+class OverlayPSPictureCache:
+    """Last rendered frame of a layer, tagged with everything but the map
+    position it was rendered at."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.tag = None
+        self.picture = None
+        self.origin = None
+
+    def get(self, tag):
+        with self.lock:
+            if self.picture is None or self.tag != tag:
+                return None
+            return self.picture, QPointF(self.origin)
+
+    def set(self, tag, picture, origin):
+        with self.lock:
+            self.tag = tag
+            self.picture = picture
+            self.origin = QPointF(origin)
+
+
+class OverlayPSLabelCache:
+    """Kilometer mark labels laid out once per font and label set.
+
+    Labels are kept as glyph outlines rather than as text, so that frames
+    recorded into a QPicture replay them without laying them out again.
+    """
+
+    maxEntries = 16
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def get(self, font, labels):
+        """Returns a dictionary of (QPainterPath, width) per label, with
+        the outline of the label in the bold font centered on the
+        origin."""
+        key = (font.toString(), frozenset(labels))
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                boldFont = QFont(font)
+                boldFont.setBold(True)
+                metrics = QFontMetricsF(boldFont)
+                entry = {}
+                for label in key[1]:
+                    w = metrics.width(label)
+                    outline = QPainterPath()
+                    outline.addText(
+                        QPointF(-0.5 * w,
+                                metrics.ascent() - 0.5 * metrics.height()),
+                        boldFont, label)
+                    entry[label] = (outline, w)
+                if len(self.entries) >= self.maxEntries:
+                    self.entries = {}
+                self.entries[key] = entry
+            return entry
 
 
 class OverlayPSLayerType(KadasPluginLayerType):
@@ -0,0 +1,115 @@
+import numpy as np
+
+from qgis.core import QgsPointXY, QgsRectangle, QgsSpatialIndex
+
+
+class OverlayPSLocator:
+    """Spatial indexes over the segments and snap points of one overlay,
+    in layer crs.
+
+    Snap points are the ends of the ring and axes and the points and tick
+    ends of the kilometer marks. Lookups return the snapped point and a
+    dictionary describing the overlay element, with its "kind" (ring,
+    mainAxis, flightLine or marks), kilometer mark "label" and the index
+    of the overlay in its layer ("overlay").
+    """
+
+    def __init__(self, geometry, row, xs, ys, overlay=0):
+        """:param geometry: OverlayPSGeometry of the overlay.
+        :param row: Row of the overlay in geometry.
+        :param xs: Vertex x coordinates of the geometry in layer crs.
+        :param ys: Vertex y coordinates of the geometry in layer crs.
+        :param overlay: Index of the overlay in its layer.
+        """
+        xs = xs[row]
+        ys = ys[row]
+        self.overlay = overlay
+
+        # Segments as vertex index pairs, and snap points as vertex indices
+        starts = []
+        infos = []
+        points = []
+        pointInfos = []
+        for (start, end), kind in zip(geometry.parts, geometry.partKinds):
+            starts.extend(range(start, end - 1))
+            infos.extend([(kind, None)] * (end - start - 1))
+            points.extend([start, end - 1])
+            pointInfos.extend([(kind, None)] * 2)
+        for idx, label in enumerate(geometry.markLabels):
+            offset = geometry.marksOffset + 3 * idx
+            starts.extend([offset, offset + 1])
+            infos.extend([("marks", label)] * 2)
+            points.extend([offset, offset + 1, offset + 2])
+            pointInfos.extend([("marks", label)] * 3)
+        starts = np.array(starts, dtype=np.int64)
+        points = np.array(points, dtype=np.int64)
+
+        self.ax = xs[starts]
+        self.ay = ys[starts]
+        self.bx = xs[starts + 1]
+        self.by = ys[starts + 1]
+        self.segmentInfos = infos
+        self.segmentIndex = QgsSpatialIndex()
+        for idx in range(len(starts)):
+            self.segmentIndex.addFeature(idx, QgsRectangle(
+                min(self.ax[idx], self.bx[idx]),
+                min(self.ay[idx], self.by[idx]),
+                max(self.ax[idx], self.bx[idx]),
+                max(self.ay[idx], self.by[idx])))
+
+        self.px = xs[points]
+        self.py = ys[points]
+        self.pointInfos = pointInfos
+        self.pointIndex = QgsSpatialIndex()
+        for idx in range(len(points)):
+            self.pointIndex.addFeature(idx, QgsRectangle(
+                self.px[idx], self.py[idx], self.px[idx], self.py[idx]))
+
+    def info(self, kind, label):
+        return {"kind": kind, "label": label, "overlay": self.overlay}
+
+    def searchRect(self, point, tolerance):
+        return QgsRectangle(point.x() - tolerance, point.y() - tolerance,
+                            point.x() + tolerance, point.y() + tolerance)
+
+    def snapToPoint(self, point, tolerance):
+        """Returns the (distance, snapped point, info) of the snap point
+        nearest to point within tolerance, or None."""
+        ids = np.array(self.pointIndex.intersects(
+            self.searchRect(point, tolerance)), dtype=np.int64)
+        if not len(ids):
+            return None
+        distance = np.hypot(self.px[ids] - point.x(),
+                            self.py[ids] - point.y())
+        nearest = distance.argmin()
+        if distance[nearest] > tolerance:
+            return None
+        idx = ids[nearest]
+        return (float(distance[nearest]),
+                QgsPointXY(self.px[idx], self.py[idx]),
+                self.info(*self.pointInfos[idx]))
+
+    def snapToSegment(self, point, tolerance):
+        """Returns the (distance, snapped point, info) of the nearest point
+        on a segment within tolerance, or None."""
+        ids = np.array(self.segmentIndex.intersects(
+            self.searchRect(point, tolerance)), dtype=np.int64)
+        if not len(ids):
+            return None
+        ax = self.ax[ids]
+        ay = self.ay[ids]
+        dx = self.bx[ids] - ax
+        dy = self.by[ids] - ay
+        lengthSq = dx * dx + dy * dy
+        lengthSq[lengthSq <= 0] = 1E-18
+        t = np.clip(((point.x() - ax) * dx + (point.y() - ay) * dy) /
+                    lengthSq, 0, 1)
+        x = ax + t * dx
+        y = ay + t * dy
+        distance = np.hypot(x - point.x(), y - point.y())
+        nearest = distance.argmin()
+        if distance[nearest] > tolerance:
+            return None
+        return (float(distance[nearest]),
+                QgsPointXY(x[nearest], y[nearest]),
+                self.info(*self.segmentInfos[ids[nearest]]))
@@ -0,0 +1,39 @@
+"""NMEA sentence parsing.
+
+This module has no Qt or QGIS dependencies, so that it can be tested
+without a running KADAS.
+"""
+
+
+def parseNmea(sentence):
+    """Returns the (lon, lat) position in degrees of a GGA or RMC NMEA
+    sentence, or None if the sentence has no valid fix."""
+    sentence = sentence.strip()
+    if not sentence.startswith("$"):
+        return None
+    if "*" in sentence:
+        sentence, checksum = sentence[1:].split("*", 1)
+        computed = 0
+        for char in sentence:
+            computed ^= ord(char)
+        try:
+            if computed != int(checksum[:2], 16):
+                return None
+        except ValueError:
+            return None
+    else:
+        sentence = sentence[1:]
+    fields = sentence.split(",")
+    kind = fields[0][-3:]
+    try:
+        if kind == "GGA" and len(fields) > 6 and fields[6] not in ("", "0"):
+            lat, ns, lon, ew = fields[2:6]
+        elif kind == "RMC" and len(fields) > 6 and fields[2] == "A":
+            lat, ns, lon, ew = fields[3:7]
+        else:
+            return None
+        lat = int(lat[:2]) + float(lat[2:]) / 60
+        lon = int(lon[:3]) + float(lon[3:]) / 60
+    except ValueError:
+        return None
+    return (-lon if ew == "W" else lon, -lat if ns == "S" else lat)
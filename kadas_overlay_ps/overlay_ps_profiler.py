@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+from qgis.core import QgsSettings
+
+try:
+    from qgis.core import QgsScopedRuntimeProfile
+except ImportError:
+    # QGIS < 3.16, stages are only recorded into the render stats
+    QgsScopedRuntimeProfile = None
+
+
+def profilingEnabled():
+    """Returns whether render profiling is enabled. The setting is read
+    for every render, so it can be toggled at runtime."""
+    return QgsSettings().value("kadas_overlay_ps/profiling", False, bool)
+
+
+def setProfilingEnabled(enabled):
+    QgsSettings().setValue("kadas_overlay_ps/profiling", enabled)
+
+
+@contextmanager
+def runtimeProfile(name, group):
+    """Times a block into the QGIS runtime profiler, if available."""
+    if QgsScopedRuntimeProfile is None:
+        yield
+        return
+    with QgsScopedRuntimeProfile(name, group):
+        yield
+
+
+class OverlayPSRenderStats:
+    """Rolling per-stage render timings and vertex/label counts of a
+    layer."""
+
+    maxSamples = 200
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}
+
+    def add(self, stage, seconds, count):
+        with self.lock:
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=self.maxSamples)
+            self.samples[stage].append((seconds, count))
+
+    def clear(self):
+        with self.lock:
+            self.samples = {}
+
+    def stages(self):
+        with self.lock:
+            return list(self.samples.keys())
+
+    def summary(self):
+        """Returns a dictionary of per-stage statistics, with times in
+        milliseconds."""
+        result = {}
+        with self.lock:
+            samples = {stage: list(values)
+                       for stage, values in self.samples.items()}
+        for stage, values in samples.items():
+            times = np.array([value[0] for value in values]) * 1000
+            counts = np.array([value[1] for value in values])
+            result[stage] = {
+                "samples": len(values),
+                "mean": float(times.mean()),
+                "min": float(times.min()),
+                "max": float(times.max()),
+                "count": float(counts.mean())
+            }
+        return result
+
+    def histogram(self, stage, bins=10):
+        """Returns the (counts, bin edges) histogram of the stage times in
+        milliseconds."""
+        with self.lock:
+            values = list(self.samples.get(stage, []))
+        times = np.array([value[0] for value in values]) * 1000
+        return np.histogram(times, bins=bins)
+
+
+class OverlayPSStageProfiler:
+    """Times stages into the QGIS runtime profiler and the render stats of
+    a layer, if profiling is enabled."""
+
+    def __init__(self, stats, enabled, group="rendering"):
+        self.stats = stats
+        self.enabled = enabled
+        self.group = group
+
+    @contextmanager
+    def stage(self, name, count=0):
+        if not self.enabled:
+            yield
+            return
+        with runtimeProfile("Overlay PS: %s" % name, self.group):
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.stats.add(name, time.perf_counter() - start, count)
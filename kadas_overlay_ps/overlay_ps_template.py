@@ -0,0 +1,274 @@
+"""Overlay templates.
+
+A template declares the rings, axes, kilometer marks and labels of an
+overlay as data. It is compiled once per sampling into an
+OverlayPSProgram, the bearings and distances from which OverlayPSGeometry
+constructs the vertices of any number of overlays.
+
+Like the geometry, this module only depends on NumPy.
+"""
+import math
+import threading
+import numpy as np
+
+from .overlay_ps_geodesic import EARTH_RADIUS
+
+
+class OverlayPSTemplate:
+    """Rings, axes, kilometer marks and labels of an overlay.
+
+    Bearings are in degrees relative to the overlay azimut, distances in
+    meters.
+
+    Rings are dictionaries of:
+        bearing: Direction of the ring center from the overlay center.
+        offset: Distance of the ring center from the overlay center.
+        radius: Ring radius.
+        span: Angle of the ring arc, centered on bearing.
+
+    Axes are dictionaries of:
+        kind: "mainAxis" or "flightLine", the stage the axis is drawn in.
+        bearing: Direction of the axis.
+        flip: Whether the kilometer marks point to the left of the axis.
+        start: Distance at which the axis line starts.
+        length: Distance at which the axis line ends.
+        markStart: Distance of the first kilometer mark.
+        markSpacing: Distance between kilometer marks, the last mark is at
+            the axis end.
+        labels: Whether the marks are labelled with their distance in
+            kilometers, except at the center.
+    """
+
+    axisKinds = ("mainAxis", "flightLine")
+    ringFields = {"bearing": float, "offset": float, "radius": float,
+                  "span": float}
+    axisFields = {"kind": str, "bearing": float, "flip": bool,
+                  "start": float, "length": float, "markStart": float,
+                  "markSpacing": float, "labels": bool}
+
+    # Minimum screen sizes in pixels of the generalised elements
+    minMarkSpacing = 4
+    minLabelSpacing = 2.5  # font sizes
+    minFlightLineLength = 12
+
+    # Number of compiled programs kept per template
+    maxPrograms = 32
+
+    defaultTemplate = None
+
+    def __init__(self, name, rings, axes, markLength=250):
+        self.name = name
+        self.rings = [self.validate(ring, self.ringFields) for ring in rings]
+        self.axes = [self.validate(axis, self.axisFields) for axis in axes]
+        for axis in self.axes:
+            if axis["kind"] not in self.axisKinds:
+                raise ValueError("Unknown axis kind: %s" % axis["kind"])
+            if axis["markSpacing"] <= 0:
+                raise ValueError("Mark spacing must be positive")
+        self.markLength = float(markLength)
+        self.key = (self.name, self.markLength,
+                    tuple(tuple(sorted(ring.items())) for ring in self.rings),
+                    tuple(tuple(sorted(axis.items())) for axis in self.axes))
+        self.lock = threading.Lock()
+        self.programs = {}
+
+    @staticmethod
+    def validate(values, fields):
+        missing = set(fields) - set(values)
+        if missing:
+            raise ValueError("Missing template fields: %s" %
+                             ", ".join(sorted(missing)))
+        return {field: convert(values[field])
+                for field, convert in fields.items()}
+
+    @classmethod
+    def default(cls):
+        """Returns the standard PS overlay template."""
+        if cls.defaultTemplate is None:
+            mainAxis = {"kind": "mainAxis", "start": 0, "length": 7000,
+                        "markStart": 0, "markSpacing": 1000, "labels": True}
+            flightLine = {"kind": "flightLine", "start": 1500,
+                          "length": 6000, "markStart": 2000,
+                          "markSpacing": 1000, "labels": True}
+            cls.defaultTemplate = OverlayPSTemplate(
+                "PS",
+                [{"bearing": 90, "offset": 1750, "radius": 1750,
+                  "span": 300}],
+                [dict(mainAxis, bearing=0, flip=False),
+                 dict(mainAxis, bearing=180, flip=True),
+                 dict(flightLine, bearing=45, flip=False),
+                 dict(flightLine, bearing=90, flip=False),
+                 dict(flightLine, bearing=135, flip=True)])
+        return cls.defaultTemplate
+
+    def isDefault(self):
+        return self.key == self.default().key
+
+    def radius(self):
+        """Returns the maximum distance of a vertex from the center in
+        meters."""
+        return max([ring["offset"] + ring["radius"] for ring in self.rings] +
+                   [math.hypot(axis["length"], self.markLength)
+                    for axis in self.axes] + [0])
+
+    def visibilityThresholds(self, fontSize):
+        """Returns the scales in pixels per kilometer below which labels,
+        kilometer marks and flight lines are skipped, in that order."""
+        markSpacing = min([axis["markSpacing"] for axis in self.axes] +
+                          [math.inf])
+        labelSpacing = min([axis["markSpacing"] for axis in self.axes
+                            if axis["labels"]] + [math.inf])
+        flightLineLength = min([axis["length"] - axis["start"]
+                                for axis in self.axes
+                                if axis["kind"] == "flightLine"] +
+                               [math.inf])
+        marks = 1000. * self.minMarkSpacing / markSpacing
+        return {
+            "labels": max(marks, 1000. * self.minLabelSpacing * fontSize /
+                          labelSpacing),
+            "marks": marks,
+            "flightLine": min(marks, 1000. * self.minFlightLineLength /
+                              max(flightLineLength, 1))
+        }
+
+    def compile(self, tolerance, latitude):
+        """Returns the program constructing this template, sampled for the
+        given chord tolerance and latitude."""
+        step = self.axisStep(tolerance, latitude)
+        key = (tolerance, step)
+        with self.lock:
+            program = self.programs.get(key)
+            if program is None:
+                if len(self.programs) >= self.maxPrograms:
+                    self.programs = {}
+                program = OverlayPSProgram(self, tolerance, step)
+                self.programs[key] = program
+            return program
+
+    @staticmethod
+    def ringSegments(span, radius, tolerance):
+        if tolerance is None:
+            return max(4, int(math.ceil(span)))
+        if tolerance >= radius:
+            return 4
+        step = math.degrees(2 * math.acos(1 - tolerance / radius))
+        return max(4, int(math.ceil(span / step)))
+
+    @staticmethod
+    def axisStep(tolerance, lat):
+        """Returns the axis sampling distance for which the deviation of
+        the geodesic from a straight map line stays within tolerance."""
+        if tolerance is None:
+            return None
+        curvature = max(1, abs(math.tan(math.radians(lat)))) / (
+            8 * EARTH_RADIUS)
+        return math.sqrt(tolerance / curvature)
+
+    @classmethod
+    def readXml(cls, element):
+        """Reads a template from a <template> DOM element."""
+        def read(childName, fields):
+            items = []
+            children = element.elementsByTagName(childName)
+            for i in range(children.count()):
+                childEl = children.at(i).toElement()
+                item = {}
+                for field, convert in fields.items():
+                    value = childEl.attribute(field)
+                    item[field] = value == "1" if convert is bool else value
+                items.append(item)
+            return items
+        return OverlayPSTemplate(
+            element.attribute("name"), read("ring", cls.ringFields),
+            read("axis", cls.axisFields),
+            float(element.attribute("markLength", "250")))
+
+    def writeXml(self, element, document):
+        """Writes the template to a <template> DOM element."""
+        element.setAttribute("name", self.name)
+        element.setAttribute("markLength", self.markLength)
+        for childName, items in (("ring", self.rings), ("axis", self.axes)):
+            for item in items:
+                childEl = document.createElement(childName)
+                for field, value in item.items():
+                    if isinstance(value, bool):
+                        value = int(value)
+                    childEl.setAttribute(field, value)
+                element.appendChild(childEl)
+
+
+class OverlayPSProgram:
+    """Bearings relative to the azimut and distances of all vertices of a
+    template at a given sampling, along with the vertex layout of the
+    resulting geometry."""
+
+    def __init__(self, template, tolerance, step):
+        self.markLength = template.markLength
+
+        # Rings as (bearing, offset, radius, arc bearings)
+        self.rings = []
+        self.partKinds = []
+        sizes = []
+        for ring in template.rings:
+            segments = template.ringSegments(ring["span"], ring["radius"],
+                                             tolerance)
+            self.rings.append((
+                ring["bearing"], ring["offset"], ring["radius"],
+                ring["bearing"] + np.linspace(-0.5 * ring["span"],
+                                              0.5 * ring["span"],
+                                              segments + 1)))
+            self.partKinds.append("ring")
+            sizes.append(segments + 1)
+
+        # Axis vertices followed by the kilometer mark points, and the
+        # directions of the marks
+        bearings = []
+        distances = []
+        markAxisBearings = []
+        markDistances = []
+        markBearings = []
+        self.markLabels = []
+        # Axis end points as (bearing, length, mark bearing, mark index)
+        self.axisEnds = []
+        for axis in template.axes:
+            bearing = axis["bearing"]
+            start = min(axis["start"], axis["length"])
+            length = axis["length"]
+            markBearing = bearing - 90 if axis["flip"] else bearing + 90
+            endMark = None
+            if axis["markStart"] <= length:
+                count = int(math.ceil(
+                    (length - axis["markStart"]) / axis["markSpacing"]))
+                for distance in np.minimum(
+                        axis["markStart"] +
+                        np.arange(count + 1) * axis["markSpacing"], length):
+                    if distance == length:
+                        endMark = len(markDistances)
+                    markAxisBearings.append(bearing)
+                    markDistances.append(float(distance))
+                    markBearings.append(markBearing)
+                    self.markLabels.append(
+                        "%g" % (distance / 1000.)
+                        if axis["labels"] and distance > 0 else None)
+            self.axisEnds.append((bearing, length, markBearing, endMark))
+            axisStep = axis["markSpacing"] if step is None else step
+            axisDistances = np.linspace(
+                start, length,
+                max(1, int(math.ceil((length - start) / axisStep))) + 1)
+            distances.extend(axisDistances)
+            bearings.extend([bearing] * len(axisDistances))
+            self.partKinds.append(axis["kind"])
+            sizes.append(len(axisDistances))
+        self.axisBearings = np.array(bearings + markAxisBearings)
+        self.axisDistances = np.array(distances + markDistances)
+        self.markBearings = np.array(markBearings)
+        self.markCount = len(markDistances)
+
+        # Vertex layout of the geometry, polylines first, followed by the
+        # (p1, point, p2) triples of the kilometer marks
+        self.parts = []
+        offset = 0
+        for size in sizes:
+            self.parts.append((offset, offset + size))
+            offset += size
+        self.marksOffset = offset
@@ -9,11 +9,17 @@ from qgis.gui import *
 from kadas.kadasgui import *
 
 from .overlay_ps_layer import OverlayPSLayer
+from .overlay_ps_canvas_item import OverlayPSCanvasItem
 
 OverlayPSWidgetBase = uic.loadUiType(os.path.join(
     os.path.dirname(__file__), 'overlay_ps_dialog_base.ui'))[0]
 
 
+def isSingleOverlayLayer(layer):
+    """Collection layers are not edited with the tool."""
+    return isinstance(layer, OverlayPSLayer) and not layer.isCollection()
+
+
 class OverlayPSTool(QgsMapTool):
 
     def __init__(self, iface):
@@ -23,10 +29,10 @@ class OverlayPSTool(QgsMapTool):
         self.picking = False
 
         layer = iface.layerTreeView().currentLayer()
-        if not layer or not isinstance(layer, OverlayPSLayer):
+        if not isSingleOverlayLayer(layer):
             for layerId  in QgsProject.instance().mapLayers():
                 projLayer = QgsProject.instance().mapLayer(layerId)
-                if isinstance(projLayer, OverlayPSLayer):
+                if isSingleOverlayLayer(projLayer):
                     layer = projLayer
                     break
 
@@ -42,6 +48,8 @@ class OverlayPSTool(QgsMapTool):
         QgsMapTool.activate(self)
 
     def deactivate(self):
+        self.widget.applyPendingChanges()
+        self.widget.hidePreview()
         self.widget.hide()
         QgsMapTool.deactivate(self)
 
@@ -72,12 +80,32 @@ class OverlayPSWidget(KadasBottomBar, OverlayPSWidgetBase):
     requestPickCenter = pyqtSignal()
     close = pyqtSignal()
 
+    # Minimum interval between two repaints while parameters change
+    repaintInterval = 40  # ms
+    # Delay after the last center or azimut change until the layer is
+    # updated, changes are previewed on the canvas meanwhile
+    settleInterval = 500  # ms
+
     def __init__(self, iface, layer):
         KadasBottomBar.__init__(self, iface.mapCanvas())
 
         self.iface = iface
         self.layerTreeView = iface.layerTreeView()
         self.currentLayer = None
+        self.setupPending = False
+        self.repaintPending = False
+
+        self.repaintTimer = QTimer(self)
+        self.repaintTimer.setSingleShot(True)
+        self.repaintTimer.setInterval(self.repaintInterval)
+        self.repaintTimer.timeout.connect(self.applyPendingChanges)
+
+        self.previewItem = None
+        self.settleTimer = QTimer(self)
+        self.settleTimer.setSingleShot(True)
+        self.settleTimer.setInterval(self.settleInterval)
+        self.settleTimer.timeout.connect(self.applyPendingChanges)
+        iface.mapCanvas().mapCanvasRefreshed.connect(self.hidePreview)
 
         self.setLayout(QHBoxLayout())
         self.layout().setSpacing(10)
@@ -86,7 +114,7 @@ class OverlayPSWidget(KadasBottomBar, OverlayPSWidgetBase):
         self.setupUi(base)
         self.layout().addWidget(base)
 
-        layerFilter = lambda layer: isinstance(layer, OverlayPSLayer)
+        layerFilter = lambda layer: isSingleOverlayLayer(layer)
         layerCreator = lambda name: self.createLayer(name)
         self.layerSelectionWidget = KadasLayerSelectionWidget(iface.mapCanvas(), iface.layerTreeView(), layerFilter, layerCreator)
         self.layerSelectionWidgetHolder.addWidget(self.layerSelectionWidget)
@@ -122,7 +150,8 @@ class OverlayPSWidget(KadasBottomBar, OverlayPSWidgetBase):
         if layer == self.currentLayer:
             return
 
-        self.currentLayer = layer if isinstance(layer, OverlayPSLayer) else False
+        self.applyPendingChanges()
+        self.currentLayer = layer if isSingleOverlayLayer(layer) else False
 
         if not self.currentLayer:
             self.widgetLayerSetup.setEnabled(False)
@@ -148,26 +177,73 @@ class OverlayPSWidget(KadasBottomBar, OverlayPSWidgetBase):
         self.inputCenter.setCoordinate(
             pos, self.iface.mapCanvas().mapSettings().destinationCrs())
 
+    def scheduleRepaint(self):
+        """Coalesces rapid parameter changes into at most one repaint per
+        repaint interval."""
+        self.repaintPending = True
+        if self.previewItem:
+            self.updatePreviewStyle()
+        if not self.settleTimer.isActive() and \
+                not self.repaintTimer.isActive():
+            self.repaintTimer.start()
+
+    def updatePreview(self):
+        if not self.previewItem:
+            self.previewItem = OverlayPSCanvasItem(self.iface.mapCanvas())
+            self.updatePreviewStyle()
+        self.previewItem.setOverlay(self.inputCenter.getCoordinate(),
+                                    self.inputCenter.getCrs(),
+                                    self.spinBoxAzimut.value(),
+                                    self.currentLayer.getTemplate())
+
+    def updatePreviewStyle(self):
+        self.previewItem.setStyle(
+            self.currentLayer.getColor(), self.currentLayer.getLineWidth(),
+            self.currentLayer.getFontSize(), self.currentLayer.transparency)
+
+    def hidePreview(self):
+        """Removes the preview once the layer shows the committed
+        changes."""
+        if not self.previewItem or self.setupPending:
+            return
+        self.iface.mapCanvas().scene().removeItem(self.previewItem)
+        self.previewItem = None
+
+    def applyPendingChanges(self):
+        self.repaintTimer.stop()
+        self.settleTimer.stop()
+        if not self.repaintPending:
+            return
+        if self.currentLayer:
+            if self.setupPending and not self.inputCenter.isEmpty():
+                self.currentLayer.setup(self.inputCenter.getCoordinate(),
+                                        self.inputCenter.getCrs(),
+                                        self.spinBoxAzimut.value())
+            self.currentLayer.triggerRepaint()
+        self.setupPending = False
+        self.repaintPending = False
+
     def updateLayer(self):
         if not self.currentLayer or self.inputCenter.isEmpty():
             return
-        center = self.inputCenter.getCoordinate()
-        crs = self.inputCenter.getCrs()
-        azimut = self.spinBoxAzimut.value()
-        self.currentLayer.setup(center, crs, azimut)
-        self.currentLayer.triggerRepaint()
+        # preview on the canvas, the layer is updated once edits settle
+        self.setupPending = True
+        self.repaintPending = True
+        self.repaintTimer.stop()
+        self.updatePreview()
+        self.settleTimer.start()
 
     def updateColor(self, color):
         if self.currentLayer:
             self.currentLayer.setColor(color)
-            self.currentLayer.triggerRepaint()
+            self.scheduleRepaint()
 
     def updateLineWidth(self, width):
         if self.currentLayer:
             self.currentLayer.setLineWidth(width)
-            self.currentLayer.triggerRepaint()
+            self.scheduleRepaint()
 
     def updateFontSize(self, fontSize):
         if self.currentLayer:
             self.currentLayer.setFontSize(fontSize)
-            self.currentLayer.triggerRepaint()
+            self.scheduleRepaint()
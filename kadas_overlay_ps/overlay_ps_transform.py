@@ -0,0 +1,107 @@
+import numpy as np
+
+from qgis.PyQt.QtGui import QPolygonF
+from qgis.core import QgsCoordinateReferenceSystem, QgsCoordinateTransform, \
+    QgsLineString, QgsProject
+
+
+class TransformPool:
+    """Coordinate transforms shared by all overlay layers, keyed by
+    (source crs, destination crs, transform context revision).
+
+    The pool is cleared whenever the transform context of the project
+    changes."""
+
+    def __init__(self):
+        self.transforms = {}
+        self.revision = 0
+        self.project = None
+        self.wgs84 = None
+
+    def wgs84Crs(self):
+        if self.wgs84 is None:
+            self.wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
+        return self.wgs84
+
+    def crsKey(self, crs):
+        return crs.authid() or crs.toWkt()
+
+    def invalidate(self):
+        self.transforms = {}
+        self.revision += 1
+
+    def transform(self, source, dest):
+        project = QgsProject.instance()
+        if project is not self.project:
+            project.transformContextChanged.connect(self.invalidate)
+            self.project = project
+            self.invalidate()
+        key = (self.crsKey(source), self.crsKey(dest), self.revision)
+        ct = self.transforms.get(key)
+        if ct is None:
+            ct = QgsCoordinateTransform(source, dest,
+                                        project.transformContext())
+            self.transforms[key] = ct
+        # Copies are implicitly shared and cheap
+        return QgsCoordinateTransform(ct)
+
+    def toWgs84(self, crs):
+        return self.transform(crs, self.wgs84Crs())
+
+    def fromWgs84(self, crs):
+        return self.transform(self.wgs84Crs(), crs)
+
+
+transformPool = TransformPool()
+
+
+def transformCoords(ct, xs, ys):
+    """Transforms coordinate arrays with a single bulk transform call.
+
+    :returns: Tuple of transformed (xs, ys) numpy arrays, of the same shape
+        as the input arrays. These are the input arrays if ct is an
+        identity transform.
+    """
+    if not ct.isValid() or ct.isShortCircuited():
+        return xs, ys
+    line = QgsLineString(xs.ravel().tolist(), ys.ravel().tolist())
+    line.transform(ct)
+    return np.array(line.xVector()).reshape(xs.shape), \
+        np.array(line.yVector()).reshape(ys.shape)
+
+
+def mapToPixelCoords(mapToPixel, xs, ys):
+    """Applies the map-to-pixel transform to coordinate arrays as one
+    affine matrix operation.
+
+    The affine coefficients are sampled from mapToPixel at the centroid of
+    the coordinates, one pixel apart in each direction.
+
+    :returns: Tuple of device (xs, ys) numpy arrays.
+    """
+    x0 = float(xs.mean())
+    y0 = float(ys.mean())
+    step = mapToPixel.mapUnitsPerPixel()
+    origin = mapToPixel.transform(x0, y0)
+    ex = mapToPixel.transform(x0 + step, y0)
+    ey = mapToPixel.transform(x0, y0 + step)
+    dx = (xs - x0) / step
+    dy = (ys - y0) / step
+    px = origin.x() + dx * (ex.x() - origin.x()) + dy * (ey.x() - origin.x())
+    py = origin.y() + dx * (ex.y() - origin.y()) + dy * (ey.y() - origin.y())
+    return px, py
+
+
+def polygonFromArrays(xs, ys):
+    """Builds a QPolygonF by writing the coordinate arrays directly into
+    its point buffer."""
+    n = len(xs)
+    poly = QPolygonF(n)
+    if n == 0:
+        return poly
+    ptr = poly.data()
+    ptr.setsize(n * 2 * np.dtype(np.float64).itemsize)
+    buffer = np.frombuffer(ptr, dtype=np.float64)
+    buffer[0::2] = xs
+    buffer[1::2] = ys
+    return poly
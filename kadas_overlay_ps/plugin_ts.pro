@@ -1,6 +1,8 @@
 SOURCES += overlay_ps_layer.py \
            overlay_ps.py \
-           overlay_ps_tool.py
+           overlay_ps_tool.py \
+           overlay_ps_import.py \
+           overlay_ps_feed.py
 
 FORMS +=   overlay_ps_dialog_base.ui
 
@@ -1,348 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.12.5)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x11\xca\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x11\x7f\x49\x44\x41\x54\x78\x9c\xed\x9d\x7b\x90\
-\x1c\xd5\x75\x87\xbf\xd3\xb3\xab\xc7\xcc\xec\x02\x7a\xcd\x4a\x2e\
-\x62\xcb\x14\x18\xa3\xd8\x71\x04\x45\x90\x23\x21\x10\xc6\x08\x99\
-\xa7\xb1\x49\xaa\x02\xae\x4a\x0a\x63\x12\x62\xa8\x14\x38\x0e\x71\
-\x28\x8b\xb2\x5d\x89\xb1\xa1\x4c\xb0\x79\x18\xaa\x92\x52\x88\x53\
-\xc1\x8e\x83\x31\x02\x49\x04\x11\x50\x60\x0d\x71\x04\xd8\xe1\x61\
-\x1c\x90\x31\x89\x66\x66\xc5\x22\x69\x67\x7a\x57\xbb\xda\xe9\x5f\
-\xfe\xd8\x1d\xa9\x67\xb6\xe7\xb1\x3b\x8f\x9d\xd9\xe9\xaf\x4a\xaa\
-\x9a\xdb\xb7\xbb\xcf\xcc\xfd\x6d\xf7\xb9\xe7\xde\x7b\x2e\x84\x84\
-\x84\x84\x84\x84\x84\xd4\xc2\x1e\x69\x41\x50\xf9\x5b\x07\x74\x5c\
-\xb3\x6d\x99\x0e\xce\x6c\x1b\x30\x17\x48\x49\xb1\xa8\xcb\xf6\x64\
-\x56\xb7\xf9\xcb\xd3\xc3\x5a\x33\xbf\x8b\x37\xd3\x59\x7d\x66\xb6\
-\x6c\x0b\x69\x30\x83\x83\xea\x4d\x65\xf4\x6c\x2a\x2b\xa5\xb2\x52\
-\x3a\xab\xaf\xc3\x44\xe3\xa7\xb2\x3a\x38\x59\x3e\xde\xaa\x22\xb0\
-\xd9\x36\xa0\xdd\x49\x65\x75\x07\x70\x9d\xbf\xcc\xe0\x01\xc1\x45\
-\x40\xaf\xaf\xf8\xc0\xe1\x1c\x27\x1c\x7f\x8c\xbd\xdb\x54\x03\x2b\
-\x10\x0a\xa0\x46\x06\x06\x14\xcf\x45\x79\xd4\x60\x5d\x99\x6a\xae\
-\x27\x36\xad\xe8\xb1\xa7\x9b\x66\x58\x95\x84\x02\xa8\x03\x7b\xa5\
-\xa8\xe3\xf2\x08\x70\x76\xc0\xe1\x96\x6d\x7c\x08\x9d\xc0\xba\xb0\
-\xc2\x6c\x58\x11\xbe\x62\xc6\x78\xf1\x31\x89\xad\xad\xda\xf8\x10\
-\x0a\xa0\x2e\xa4\x87\xb5\xc6\x72\x3c\x24\xd1\xa5\xa2\x63\x66\x5c\
-\x9e\x77\x0c\x5b\x91\xf0\x15\x50\x23\xe9\x61\xad\x91\xc7\x36\x7c\
-\x0e\x9f\x41\x4e\x10\xf1\xd7\x13\xdc\xbe\x3c\x6e\x37\x34\xdd\xc0\
-\x0a\x84\x4f\x80\x1a\x08\x6a\x7c\xc0\xcd\xe5\xf8\x84\x60\x97\xbf\
-\xae\x89\x35\xa5\x82\x45\xb3\x49\x28\x80\x0a\xec\xdb\xa7\x9e\x5f\
-\x4a\xf3\x8b\xcb\x4b\x35\xbe\x27\x36\xad\x38\xc6\xb6\x47\x86\xd9\
-\x74\x44\x04\xa2\xbf\x7b\x8c\x8d\x2b\xcd\x0e\x35\xc9\xec\x90\x7a\
-\x90\x92\x62\xe9\xac\x9e\x4a\x66\xb5\xcd\xff\xd7\x5b\x14\xe4\xc9\
-\xff\xcb\xee\xcd\xe8\x4c\xff\xf9\x03\x03\x8a\xa7\xb2\xba\x63\x70\
-\x50\xbd\x53\xaf\xde\x1a\x84\x3e\x40\x09\x06\x07\xd5\x7b\x78\x1e\
-\xdb\x30\xd6\x00\x18\x3c\x36\x14\xe3\xd2\xde\x11\x56\x97\xfc\xcb\
-\x6f\x61\x6f\xbf\x14\xa1\x00\x4a\x90\xce\xea\x46\xc1\x37\xfc\x65\
-\x66\xf4\x0b\x56\xa1\xb9\xd1\xf8\x10\x0a\xa0\x24\x92\x2c\x9d\xe5\
-\x6e\x8c\xcf\x95\xa9\xd6\xd6\x8d\x0f\xa1\x13\x58\x12\x33\x53\x22\
-\xce\x1f\x9b\xf1\x9d\xe0\x0a\xed\xdf\xf8\x10\x0a\xa0\x2c\x66\x26\
-\x8c\xef\x61\x8c\x4d\x39\x28\x5e\x1e\x8d\xf3\xfc\x2c\x98\x55\x57\
-\x42\x01\x94\x61\xb2\xab\xf7\x18\x62\x5e\xc0\xe1\xd3\xa3\x2e\x3f\
-\x0c\xea\x22\xb6\x13\xa1\x00\x4a\x10\x18\xe1\x33\x0e\xfb\xeb\x08\
-\xce\x8f\xbb\xfc\xa8\x15\x03\x3c\xd5\x12\x0a\x20\x80\x92\x41\x1e\
-\x8f\x73\x11\xf7\xfa\xeb\x9a\xe8\x8d\xbf\x43\x77\x73\x2d\x0c\xa9\
-\x99\xc1\x41\xf5\x0e\x64\xd5\x57\x5c\x5e\x29\xc8\x23\xc9\x52\x19\
-\xdd\x93\xca\x4a\xa9\x8c\x9e\x6d\xe5\x20\x4f\x48\x09\x7c\xd3\xb8\
-\x5e\xdd\xe7\x6a\x79\xbe\xbc\xda\x08\xdf\x44\x17\x51\x37\xcc\x85\
-\xc6\xef\xb8\x38\xc0\x64\x84\x6f\x3b\xc6\x19\x00\x82\xd7\xbb\x8c\
-\xb3\x3d\xe3\xbd\x73\x29\xc2\x57\x2d\x5d\xb3\x6d\x40\xb3\x19\x9f\
-\xc7\xb9\x18\xbf\x93\xff\x6c\x70\x52\x0e\x9e\x35\x8f\x45\x40\x8f\
-\xaf\xea\x9c\x6f\x7c\xe8\xc0\x27\x00\x40\xda\xd5\x35\x12\x77\x51\
-\xfa\xfb\x77\x44\xe3\x43\x87\x0a\x00\x20\xe5\xea\xaa\x49\x8f\xbe\
-\xb8\x27\x34\xec\x89\xf3\x3b\xa1\xf1\xa1\x83\xbb\x81\x66\xbc\x8c\
-\x31\x5a\x5c\x2e\x63\xb0\xdb\xe1\x7f\x66\xc3\xa6\xd9\xa0\x23\x05\
-\x70\xa4\x9f\x2f\x16\x16\x1f\x33\x71\x7c\x4e\x3c\xe1\xef\x1d\xcc\
-\x65\x3a\x4e\x00\x81\x41\x9e\x89\x27\x81\x7f\x3e\xe7\xc9\x39\xb1\
-\x33\x28\x4e\x30\xd7\xe8\x28\x01\x94\x89\xf0\x7d\x1c\xe3\x6a\xc0\
-\x3b\x52\x2a\xf6\x47\x46\x19\x6e\xb6\x8d\x21\x35\x32\x38\xa8\xde\
-\x74\x56\x1f\x2e\x2e\xaf\x26\xc8\x93\x76\x75\x4d\x2a\x2b\x2f\x8c\
-\xf0\xb5\x29\xbe\x08\xdf\xfe\xbd\xae\x4e\xcb\x97\x57\x1b\xe1\x03\
-\x48\x67\x74\x59\x27\x35\xfe\x9c\xe9\x06\xa6\xa4\x98\xb9\x3c\x2a\
-\xc8\x37\xea\x41\x39\x7c\xdc\x81\x48\x27\x46\xf8\xaa\x65\xce\x08\
-\x20\x39\xac\xd3\xcd\x63\x27\x10\xcb\x97\x49\x64\x71\x30\xd3\xd1\
-\x32\xc2\xc6\x2f\x60\xce\x08\x00\x20\x99\xd1\x7a\x33\xb6\x42\x41\
-\x83\xfb\x09\x1b\xbf\x88\x39\x25\x00\x80\x81\x21\xad\xf5\x22\x6c\
-\x47\x44\x0b\x0e\x18\x23\x87\xc7\xb9\xba\xbb\x8b\x8c\x41\x02\xd1\
-\xeb\x4d\x2c\xdf\xf2\x1c\xe3\xa0\x20\xed\xe5\xf8\xc5\xfe\x1e\xde\
-\x5c\x65\x36\x75\x0a\xd8\x1c\x65\xce\x09\x20\x3d\xac\x35\x12\x8f\
-\x53\xf8\xd8\x47\x54\xfd\x65\x47\x05\xcf\x23\x9e\x8c\x38\x3c\xb4\
-\x2c\x66\x2f\x34\xc0\xcc\x96\x61\x4e\x09\x60\xb2\x9f\xbf\x9d\xc2\
-\x51\xbd\x5a\x79\x19\xb8\x9f\x18\xf7\xf5\x99\xb9\x75\xbc\x6e\x4b\
-\x30\x67\x04\x30\x30\xa2\x33\x73\x39\x76\x18\x34\x66\x92\xa6\x91\
-\x15\xec\x18\x17\x9b\x8f\x8f\xdb\xcf\x2b\x55\xff\xbf\x21\x7d\x20\
-\x12\x39\x9a\x35\x24\x97\x63\xd7\x7b\x7a\xed\x17\xad\x76\x5e\x5b\
-\xcd\x07\x48\x49\x31\x5c\x1e\x94\xb8\x75\x79\x8f\x3d\x75\xa4\x3c\
-\xab\xeb\xbd\x1c\xb7\x5b\x23\x23\x9b\x22\x6e\xf0\xc9\x2e\x58\x9b\
-\xce\xea\x8a\x44\xdc\x1e\x2f\x57\x3d\x12\x61\x1d\xe2\x3e\xdf\xe7\
-\xcf\x02\x15\x1b\xa4\xd9\xe7\xb5\x4d\x28\x78\x70\x50\xbd\x64\x79\
-\x1c\xd8\x64\xc6\xc3\x13\xef\x7a\x75\xa5\x5c\xdd\x0f\x7c\x8b\x26\
-\x7d\x17\x83\x65\x82\xed\xa9\xac\xee\x78\x59\x0a\x9a\x2e\xde\x56\
-\xb4\xcd\x13\x60\x6c\x3e\x0f\x1a\x13\x0b\x35\x81\x5e\x79\x6c\x1f\
-\x18\x21\x89\x38\xa9\x8a\xd3\x5d\x8c\x9f\x19\xec\x10\xbc\xe0\x79\
-\xbc\xae\x08\xd9\xf1\x31\xb2\x5d\xf3\x88\x5b\x8e\xb8\xe3\x70\x12\
-\xe2\x14\x83\x75\x93\xc1\xa4\x52\x5d\x49\x98\x78\x75\x5e\xb7\xc4\
-\xe5\x23\xfb\xf7\xeb\xe2\xe3\x8e\xb3\x03\x35\x7f\xc1\x59\xa2\x6d\
-\x04\xe0\x38\xdc\x22\x8f\x35\x1c\x8d\xe8\xf5\xc8\x2b\xef\xec\x09\
-\x76\x19\xdc\xe3\xc5\x78\x68\x85\x59\xc1\xc0\xce\x5e\x57\xab\xe7\
-\x77\x73\x1e\xe2\xe8\xb3\xc3\xd8\x27\xf8\xa1\xe0\x11\xf3\xf8\x6d\
-\x8c\xf5\xc0\x89\x65\xae\x7f\xe6\xd8\x3c\xfe\x3b\x9d\xd5\xb7\x64\
-\x14\x88\x40\x62\x9d\x15\x7d\x4e\xb9\xc5\x09\x64\x02\xae\xd9\xa0\
-\xf3\x3c\xd8\xbd\x22\x66\xbb\x8b\xcf\x6b\x2b\x27\x70\x1a\x5e\xfe\
-\x73\xe6\x71\x43\xa2\xd7\x9e\x29\x55\x21\x99\xd1\x66\x33\xbe\x5c\
-\x5f\x0b\x5b\x17\x89\x5b\x96\xf7\xd8\xe6\xe2\xf2\xb6\xf1\x01\x00\
-\xde\x59\xc8\x7f\x61\x0c\x94\xa9\x32\x22\x71\x6d\x22\xc6\x47\xcb\
-\x35\x7e\xc8\x51\xda\xe6\x15\x00\xb0\x64\x84\x07\x24\x4e\x08\x3c\
-\x28\x24\x71\xed\xf2\x5e\xfb\xbb\x26\x9b\xd5\xd6\xb4\x8d\x00\x92\
-\x59\x7d\x41\x1e\x9f\x2e\x59\xc1\x30\x33\xee\x4c\x66\xf4\xa6\xbf\
-\x8b\x58\x0a\x39\x3c\x6c\xf0\xbf\x15\xeb\x4d\xbc\x5b\x3f\xe3\xfb\
-\xfc\x03\xc7\x61\x8d\xc4\x7b\x02\x4f\x70\xf8\x36\xe2\xa5\x29\xe7\
-\xc1\x16\xb3\xc2\xc4\x51\x55\xdd\xaf\x4e\xe7\xc9\x98\xf2\xfe\x87\
-\x16\x13\xc0\xe0\xa0\x7a\xc7\x16\x72\xf2\xf2\xa8\x15\x2c\xbb\x4e\
-\x8e\xe8\x6c\xf3\xf8\x1b\x82\x7c\x21\xc3\x43\x47\x5e\x65\x31\x8c\
-\x9b\x80\x8a\x02\x98\x74\x88\x02\x7f\x14\x3f\x29\x57\xa0\xa3\x3f\
-\xac\x39\x6c\x97\xc7\xb5\x32\x76\x19\x01\x3d\x10\x8f\x8b\x9d\x61\
-\x6e\xf2\x62\x14\x9e\x67\xec\xea\x8b\xd9\xfd\xd3\xbe\x5f\x83\xcf\
-\x6b\x19\x1f\x20\x9f\x93\xc7\x3c\x76\x26\x33\x5a\x9f\x2f\x4f\x0f\
-\x6b\x8d\x4d\x2c\xd1\x0e\xb2\xd5\x45\x5c\x09\x0c\x01\x20\xfa\xe7\
-\x8d\x72\x79\xa3\x6d\xed\xeb\xb1\x01\xc4\xa5\x40\x50\x68\xf8\x78\
-\x2f\xca\x97\x1a\x6d\x43\xbd\x68\x09\x01\xa4\xa4\xd8\xf8\x7c\x7e\
-\x3c\x99\x90\x29\x66\xc6\xa3\xa9\x8c\x36\x1c\xf1\xfa\x15\x1c\xde\
-\x15\x7c\xbe\x2f\x6e\xdf\x33\x87\x8d\x82\xed\xdd\x63\x6c\x5c\xbc\
-\xd8\x86\x9a\x61\xf3\xf2\x1e\x7b\x45\xf0\xa7\x25\x0e\x5f\xeb\x89\
-\x78\x33\xec\xa8\x95\x96\xe8\x06\xa6\xb3\xfa\xb0\x26\x1e\xdb\xc7\
-\xfa\x8a\x47\x26\x1f\xef\xa5\x02\x32\x4f\x26\x62\x9c\x63\x66\x95\
-\x3b\xc9\x35\x50\x2e\xc6\x2e\xc9\xd2\x2e\xff\x06\x6c\x28\x3e\x4f\
-\xe2\xdb\xe6\xf0\x52\xd0\x79\x33\xbd\x5f\x23\xce\x6b\x09\x01\x00\
-\xec\x75\x75\x9a\x23\x1e\xa7\x50\x04\xa5\x90\x03\xab\x97\xc5\xed\
-\xc5\x4a\x15\x53\x59\xfd\x85\x39\x3c\x95\x88\x5a\x7f\xed\x56\x4e\
-\x25\x9d\xd5\x6f\x09\x5e\x60\xea\x6f\xf9\xeb\x44\x8c\x95\x66\xe6\
-\x05\x9d\xd7\x2a\xb4\xc4\x2b\x00\x60\x45\xcc\x7e\xea\x18\x1b\x2c\
-\xff\x3e\x2f\xcf\xd6\x6a\x1a\x3f\x99\xd1\x66\xe0\xaf\xe5\xf1\xb8\
-\xdf\xaf\xa8\x27\x89\xb8\xbd\x84\xf8\x71\xc0\xa1\xdf\x48\x67\x39\
-\xab\x11\xf7\xac\x27\x2d\x23\x00\x00\x19\x0b\x64\x85\x49\x96\x4b\
-\xd4\xbb\xa7\x52\x9d\x54\x56\x37\xf9\x22\x7d\xb1\xfc\x00\x52\xcd\
-\x46\x06\xd9\xe3\x14\x66\x0d\x39\x82\x71\x41\x23\xee\x57\x4f\x5a\
-\x46\x00\xbe\xe5\x5a\xe5\x06\x61\x00\xde\xe9\x8b\xb2\xbd\xd2\xf5\
-\xcc\xe1\xdf\x29\x7c\x9a\xf4\x36\xea\x49\xd0\x17\x65\x07\xb0\x2f\
-\xe0\xd0\xc7\xea\x7d\xaf\x7a\xd3\x12\x02\x08\x5a\xb1\x23\x71\x28\
-\xd0\xbb\x33\x5e\x34\xb3\x29\x1b\x33\x14\x93\x88\x5a\xbf\x39\x6c\
-\xa4\x50\x04\x31\x33\xb6\x06\x89\x20\x39\xac\xd3\x67\xba\x1e\x60\
-\xd2\x9e\x27\x02\x0e\xfd\x66\xab\xaf\x31\x98\x75\x01\x94\x5a\xae\
-\x25\xf1\xf9\x20\x0f\xd5\x72\xec\xa8\xf6\xda\xd5\x8a\x20\x99\xd1\
-\x7a\xf3\xd8\x79\x78\x1e\xdb\x66\xda\x60\x12\xff\x11\x64\xee\xd8\
-\x02\x3e\x30\x93\xeb\x35\x8b\xa6\x08\x60\x70\x50\xbd\xe9\x8c\x2e\
-\x2b\x2e\x2f\x97\x72\xdd\x31\xb2\x81\x17\x73\x98\xd6\x24\xcd\x4a\
-\x22\x18\x18\xd2\x5a\x73\x78\x84\x89\x28\xe2\x9a\x99\x8a\xc0\xe0\
-\xd5\xc0\x72\x95\x1e\x4e\x6e\x05\x1a\x2e\x80\x7c\x84\x4f\xc6\xf7\
-\xd3\xae\xae\xc9\x97\x97\xcd\xb7\xdf\x63\x4f\x0b\x16\x05\x5d\xcf\
-\x72\xbc\x35\x5d\x1b\x4a\x89\x00\xd8\x96\x73\x78\x1c\x7f\xd0\xc6\
-\xf8\xe0\xf8\x7c\xde\x37\xdd\x7b\x94\xb4\x4b\x2c\x9e\xee\xb5\x9a\
-\x49\x43\xc7\x02\xa6\x24\x64\x12\x77\x25\x33\x8a\x38\x11\x76\x57\
-\x5a\xae\x65\x46\xf0\x5f\x61\x84\xcc\x5e\x57\xab\xcd\xe3\xa2\x7c\
-\x91\x1c\x1e\x0e\x9a\xec\xe0\x27\x11\xb5\xfe\xf4\xb0\x36\xfa\xef\
-\x6b\x46\x71\x82\xc7\x03\x9e\x71\xee\x8a\x98\xfd\x6c\xba\xdf\xd5\
-\x8b\x30\x14\x18\x54\x71\xea\x3a\x43\xb9\xee\x34\x54\x00\xb9\xf9\
-\x44\x29\x0c\xec\x98\x19\x77\x4a\x8c\x42\xc1\x8f\x3f\x75\xc5\x8e\
-\x11\x09\x1a\xfc\x19\xf7\x18\x77\x22\xac\xc6\x37\x99\x63\x72\x54\
-\xaf\xe2\xc0\xce\x11\x11\x04\xad\x1b\x30\x5c\x8c\xf3\x56\x44\xed\
-\xa7\xd5\x7e\x3f\x3f\x63\x39\xc6\xe7\x07\xfc\x9a\x46\x6b\x27\x91\
-\x6c\xe8\x2b\x60\x59\xdc\x52\x11\x63\x03\xf0\x9a\xaf\xd8\x50\x85\
-\xc6\x07\x50\xb0\x0f\x60\xdd\xb5\xc5\xd8\x6d\x9c\x88\x02\xbe\xb7\
-\x81\x43\x6e\x6a\xc6\x90\x6a\xe9\x9e\x1f\xfc\x97\x2e\x55\x15\xd8\
-\x9a\x35\x1a\xee\x03\x2c\x8d\x59\xd2\xe0\x2c\x60\x4f\xf1\x31\x89\
-\xb1\x52\x6b\xf5\x54\x22\x22\x68\x22\x31\x53\x5b\x92\x19\xad\xf7\
-\x1c\xb6\x59\x40\x6a\x18\xc4\xc2\x52\x5d\xc4\x6a\x30\xaf\x84\x5d\
-\xd6\xe1\x02\x98\xbc\xcb\xfb\x81\x25\xc5\xc5\x66\x74\x1b\x7c\x28\
-\xf0\x1c\x4d\x15\x0c\x80\x79\x33\xeb\x56\x25\x87\x75\x7a\xf1\xc2\
-\x51\x89\xac\xac\x60\x48\xb7\x64\x9c\xa0\x12\x8e\x38\x39\xa8\x5c\
-\x1e\x6f\x4e\xdf\xda\xe6\xd1\x70\x01\xf8\xbc\xfd\xa0\x47\xa4\x99\
-\x71\xa7\xbf\x77\x90\xa7\xcb\x09\x5e\xd4\x20\xe3\xb4\xa0\xf2\x4a\
-\xd8\x42\x5e\x06\xfc\xef\xf7\x83\x44\x38\xc7\x31\xce\xa5\xca\x60\
-\x51\x39\x44\xb0\x5d\xa5\xbe\x47\xab\xd0\x50\x01\x94\xe8\xea\x0d\
-\x03\xbf\xf6\x7d\x36\x89\xbb\x8a\xe3\x04\x4b\x63\x96\x04\x92\x53\
-\x2e\x2a\xce\x99\x89\x2d\x7d\x66\x6e\xf7\x28\x17\x21\xfa\x99\xf0\
-\xf6\x3f\xb6\x3c\x6a\xcf\x4f\x37\x62\x58\x26\x83\x48\x90\x5d\xe9\
-\x25\xd1\x80\xef\xd0\x42\x34\x4c\x00\x65\xfa\xf9\xe7\x1b\x9c\xce\
-\xc4\xa2\xcb\x09\xc4\x4f\xba\xc6\x08\x5a\x6a\xf5\x64\x40\xd9\x29\
-\x46\x89\xf9\x78\x15\x58\xbc\xd8\x86\xba\xc7\xd8\x68\xb0\x7e\x45\
-\xec\xa8\xb7\x5f\xad\x08\xd2\xae\xae\x91\xf1\xfd\xe2\x60\xd1\xde\
-\x8c\x3e\x08\xac\x0a\xb8\xe5\x13\x8d\x9e\xaf\x50\x2b\x35\x09\x60\
-\x32\x21\xd3\x0d\x92\x0a\xba\xc0\x95\x82\x3c\x89\xb8\xa5\x23\x13\
-\x8f\xde\xd7\xf2\x9b\x2a\x06\xcd\xe4\x31\x82\x07\x7d\x24\x3e\x3a\
-\x53\x9b\x17\x2f\xb6\xa1\x44\x7c\x6a\x3f\xbf\x92\x08\x52\xae\xae\
-\x92\xf8\x0e\x60\x18\x6b\xc6\xe7\xb3\xf3\xad\x03\x3a\x0e\x20\x62\
-\xfc\x61\xa0\x9d\x54\x1f\xb6\x9e\x2d\x66\x3c\x21\xa4\x60\x5f\x3d\
-\x71\xef\xc4\x06\x4b\xa6\x4a\x8d\xef\xbf\xc6\x40\x56\x7d\x91\x51\
-\x86\x4b\x4d\xe3\x1a\x18\x50\xdc\x8b\x91\xa4\x68\x7a\x95\x8c\x51\
-\xf3\x4f\x13\x33\x3e\x5b\xcd\x04\xc8\x6a\x28\x99\x47\x70\x62\xdb\
-\x18\xff\xef\xf5\x9a\x03\x67\x77\x1f\xe6\xd0\x68\x37\x7b\x98\x3a\
-\x91\x65\x64\xde\x18\xcb\x17\x2d\xb2\x83\xf5\xb0\xab\x51\xcc\x48\
-\x00\xfb\xf6\xa9\x27\xb7\x80\xed\xf9\x4d\x15\x01\x10\xf7\x5a\x84\
-\x2d\xf2\x78\x8c\x3a\x26\x64\x4a\x66\xb5\xc5\xe0\xca\x72\x75\x8a\
-\xa7\x40\x57\x3b\x1d\xaa\x14\x25\x44\xec\xe7\xb5\x88\xb1\x61\x69\
-\xcc\x92\xe9\xac\xbe\x2e\xf8\xf3\x80\x3a\xff\xd8\x17\xb7\x2b\x66\
-\x6a\x43\xb3\x98\x91\x00\x5e\x96\xe6\x2d\x76\xf9\x01\x70\x61\xd1\
-\xa1\xc3\x14\x46\xbe\x6a\xce\xc9\x33\x90\xd5\x47\x3c\x63\x37\x9a\
-\x86\xad\x75\x78\x22\x4c\x66\x1a\x79\xa2\x38\x9d\xac\x8c\xb7\xbb\
-\xe0\x8c\xa5\x31\xdb\x9b\xcc\x68\x95\x19\x2f\x30\x35\xda\x27\xc7\
-\x38\xb5\x1d\xb2\x8b\xcc\xc8\x07\x58\x65\x36\x96\x89\xf1\x69\x83\
-\xc7\x8a\x0e\xd5\xb5\xf1\x01\x96\xc5\xed\x45\xc4\xb4\x63\xf3\xb5\
-\x22\xb1\x2a\x68\x36\xb2\x89\xc5\xe3\x1e\x27\xee\x95\xa2\x66\xfc\
-\x13\xc1\xa1\xde\xad\xed\xd0\xf8\x50\x83\x13\x78\xa2\xd9\xe8\x3b\
-\x31\x2e\x31\x0b\x18\x07\x17\xe3\x12\x17\xd4\x2b\x1b\x97\x8c\x7f\
-\xa9\xc7\x75\xaa\x25\xed\xea\x1a\xc4\x77\x09\xfe\x7d\xa2\x66\x6c\
-\x75\x5c\x1e\x26\x38\x88\x35\x26\xf1\xc5\xc6\x5a\x58\x3f\x6a\x1a\
-\x0c\x5a\x32\xc2\xa9\x82\x29\x69\x59\x31\xba\x0c\xae\x90\xf4\x74\
-\x3d\x66\xc5\x7a\x39\x1e\x8c\x38\x9c\x01\x6c\x0a\xac\xe0\xf0\x1a\
-\xe2\x76\x26\x13\x3e\xe7\x72\x95\x97\x52\x95\x22\x9d\xd1\x65\x53\
-\x36\x93\x30\xde\x32\xb1\x48\x47\x83\x59\x31\x82\xfb\xfd\x00\xb7\
-\x2d\xef\xb1\x57\x66\x7a\xff\x66\x33\xe3\x5e\x40\x15\x8e\x12\xfe\
-\xde\xc1\x4c\xef\x93\x67\x8f\xb4\x20\xea\xf2\x8c\x60\x75\xf0\xad\
-\xf8\x87\x77\x63\x5c\x55\x6b\x8a\xb7\xe2\x8c\xa3\x15\xf6\x14\x2a\
-\xc0\x60\xf7\x70\x8c\xdf\x5d\x69\x76\xa8\x16\x1b\x9a\xc9\x8c\x5e\
-\x01\x25\xba\x4a\x2e\xf0\x5c\x41\x45\xe3\x73\x03\x2e\x37\xd4\x62\
-\x60\x9e\x95\x66\x87\x18\xe7\x72\x20\x30\x1b\x87\xc1\x95\x8b\x5d\
-\x76\xa5\x46\xb4\xb2\x96\xfb\xf4\x99\xb9\x5d\xa3\x5c\x38\x19\x31\
-\x7c\xad\xcb\x38\x6b\x69\xcc\xf6\xca\x48\x51\x7e\x31\xe9\x01\xc6\
-\xb9\x7c\xa5\xd9\xa1\x76\xda\x55\x6c\xda\x02\x28\x93\x72\x7d\x53\
-\x26\xc6\xfa\x02\xc7\x50\xf4\x77\x8d\xf2\xdd\x3a\xd8\x09\x40\xe2\
-\x58\x7b\xc3\x1c\x36\x41\xc0\x5e\xbe\x13\x9c\x4e\x8e\x9f\x27\x33\
-\xda\x5c\x4b\xfe\x9e\x7c\xc4\xd0\x81\xb3\x97\x44\xd9\x97\xca\xea\
-\x7a\x72\xbc\x08\x9c\x12\x78\x82\x00\xf1\xe5\xc4\xb1\xf6\x46\x7e\
-\xd7\x71\xc1\x37\x6b\x99\x63\xd8\x2c\x02\x5f\x01\x83\x83\xea\x3d\
-\x3c\x9f\xaf\x38\xc3\x7c\x69\xd9\x32\x3b\x32\x2e\x5f\x4d\x90\xe7\
-\x48\x17\x51\x2c\x69\xd4\x5a\xbd\x94\xab\x3b\x51\xc9\x75\x79\x79\
-\x7e\x25\xf1\x8d\xc8\x08\x5b\xfc\xdf\xa1\x5a\x06\x06\x14\xd7\x42\
-\xae\x94\xf1\x05\xa0\x9a\xa7\x8a\x2b\x71\x81\xc1\xef\x17\x6c\x39\
-\x2f\xfa\x23\x87\x38\x6f\xe9\x52\xcb\x4c\xd7\x86\x66\x30\x45\x00\
-\xfe\x08\x9f\x60\x57\x64\x98\x4d\xcb\x96\x59\x76\x3a\x11\xbe\x5f\
-\x4a\xf3\x8f\x7d\x87\x79\x8d\xfa\xd2\x93\x1b\x3e\xdd\x57\xb9\x26\
-\x30\x31\xf8\xf4\x23\x83\x6d\x8a\xb0\xab\x6f\xa1\x05\x0e\x33\x03\
-\xa4\x46\xb4\xd2\x72\xac\x13\x6c\x04\x2e\xa2\x7c\xa2\xa8\x89\xa9\
-\x2d\xbe\xf8\x84\x19\x87\xa5\xc2\x6e\xa1\x60\xfb\xa1\x18\x97\xb4\
-\xaa\x5f\x50\x20\x80\x3d\xd2\x82\x85\x59\x76\xfa\x23\x7c\x82\x5d\
-\xdd\x62\xf3\xb8\xf1\xaf\xb4\x48\xca\xf5\x69\x0a\xa0\x18\x17\x78\
-\xd3\x60\xbf\x60\xcc\x60\x9e\xe0\x38\xe0\xfd\x54\x6a\xf0\x42\x5e\
-\x25\xc2\x57\xc9\x71\x37\x25\x1c\x43\x83\xc7\x86\x62\x5c\x7a\xa2\
-\xd9\x94\xcd\xa9\x5a\x85\x82\x6e\xe0\x4a\xb3\x43\xa9\x8c\x76\x72\
-\x34\x1d\x1b\x06\xeb\xc6\x8d\x1d\x50\xb0\x64\xab\xa5\xb2\x6e\x4b\
-\xec\x32\x63\x2d\xd5\xf5\x6a\x62\xc0\x87\xf2\xdd\x92\x19\x74\x4f\
-\x84\xb8\x9f\x38\x7f\xd6\x67\xe6\xa6\x87\xf5\x2b\x89\x27\x8b\xb7\
-\x98\x17\xfc\xe7\x48\x8c\x4f\xb6\x72\xe3\x43\x80\x13\xd8\xd7\x63\
-\x7f\x65\x70\x6b\x51\x71\xc4\xf7\x43\xb5\x54\xe3\x03\x98\xc3\x16\
-\xf3\x58\x3b\xb9\x4a\xb7\x71\xf7\x81\xdd\xe6\xb1\xb6\xaf\xc7\xae\
-\xee\x33\x73\x25\x19\xe2\x0f\x8a\x1b\x1f\xc0\x8c\x53\x16\x64\x8f\
-\xee\x50\xda\xaa\x04\xf6\x02\x12\x71\xfb\xa2\x19\x7f\xef\x2f\xb3\
-\x89\xff\x72\x5e\x8e\x4f\xb5\x52\xe3\xe7\x49\xf4\xda\xb3\x7d\x31\
-\x4e\xc5\xb8\x04\xf1\x93\x3a\x5f\xfe\x39\x8c\x8b\x97\xc5\x38\x2d\
-\xd1\x6b\xcf\x42\x7e\x03\x69\xee\x96\xf8\x93\xc0\x33\x34\xf3\xe9\
-\x65\xcd\x24\xf0\x91\x59\x36\xc8\x63\x3c\x13\x19\xe6\xfc\x66\x7a\
-\xb5\xc5\xc9\x0f\x2a\x25\x44\xca\xe5\xd8\x15\x71\x98\x67\x70\x85\
-\x07\x97\x04\xe6\xf2\xa9\x80\xe0\x75\x07\x1e\x12\x3c\xd0\x17\x90\
-\x1c\x3a\x9d\xd5\x8d\x82\x6f\xf8\xcb\xcc\xe8\x17\xac\x42\x53\x96\
-\xb9\x7d\xa2\x9a\xc4\x55\xb3\xc1\x14\x01\x54\x13\xe1\xf3\xf7\x0e\
-\x1a\x6a\xdd\x24\xd3\x76\xfa\x8a\x46\x03\xf7\xb9\x5a\x91\xf3\x58\
-\x27\x38\xc5\x8c\x93\x80\x84\x41\xaf\xa0\xd7\x60\x48\x90\x01\xd2\
-\x12\xaf\x1b\xbc\x12\x71\x78\x7a\x69\xcc\xf6\x96\xbb\x45\xc1\x7c\
-\x08\x8e\x3a\x7c\xbd\x23\xac\x2e\xb1\xd6\xb1\x25\x45\x50\x20\x80\
-\xb7\x0f\x6a\x51\x77\x84\x37\x28\x9c\xdc\x30\x64\xf0\xb0\xa0\x78\
-\x6c\xfb\x6f\xfb\xe2\x76\x7d\xc3\x2d\xa4\x76\x01\x34\x8a\xc9\xec\
-\xe5\x5b\x05\x87\xfc\x5d\xbd\x32\x0b\x5e\x0b\x44\x30\x30\xa0\xb8\
-\x17\xe5\x6b\xdd\xa3\xdc\xdc\xac\xdc\x46\xc5\x14\xf8\x00\xc7\x1f\
-\x63\xef\x22\xae\x01\xf2\xcb\xaf\x5d\x4f\x5c\x98\x88\xdb\x95\x05\
-\x8e\xa1\xe8\xef\x1e\xe5\xe6\x26\xda\xd9\x92\xf4\x99\xb9\x91\x11\
-\x2e\xcc\xc6\xb8\xd8\xdf\xcf\xaf\x66\x8e\xe1\xc0\x80\xe2\xb9\x28\
-\x8f\x02\xd7\xcd\x66\xc4\x30\xd0\x07\x48\x65\xf4\x7b\x18\xf7\x7a\
-\xe2\x22\xbf\xc3\x97\xca\xe8\xab\xc0\x86\x66\x66\xe3\x82\x99\xf9\
-\x00\xb5\xcc\x08\xaa\x17\x25\x83\x67\x39\x3e\x65\x11\xfe\xd2\x38\
-\xfa\x9d\x10\xfd\x23\x71\x36\xb4\x4c\xc0\x28\x3f\xe1\xb1\x98\x3d\
-\x52\xf1\x82\xca\xa6\x93\x72\x75\x55\xc1\x26\x90\xae\xae\x9a\x6d\
-\x9b\x4a\x11\xb4\x69\x65\x3a\xab\xf1\xa2\x4d\x2c\x95\xcc\xea\x9b\
-\xb3\x61\x5f\xc9\xc1\xa0\xf7\x1e\x6b\xfb\x83\xca\x5b\x46\xa1\x6d\
-\x42\xf1\xeb\x60\x62\xdc\xa8\x30\x0f\x92\xc1\xad\xcb\xe3\x76\xe3\
-\x6c\xd8\x37\xeb\x19\x42\x3a\x81\x44\xd4\xfa\x15\xe1\x12\x33\xc6\
-\x03\xde\xb9\xff\x9c\x88\xdb\xac\xcd\x20\x0a\x05\xd0\x04\xf6\x4a\
-\x51\xcb\x71\xb3\x14\x38\x03\xeb\x82\xd9\x0c\x16\x85\x02\x68\x30\
-\x03\x03\x8a\x9b\xcb\x36\xe0\xec\x12\x55\x66\x35\x62\x18\x0a\xa0\
-\xc1\x78\x51\xbe\x56\xe0\xed\x03\x06\x0f\x30\xb5\x8b\xf8\xd0\xdb\
-\x07\x15\x98\x16\xa7\x91\x84\x02\x68\x30\xdd\xa3\xdc\x3c\x39\xbd\
-\x0c\x98\x70\xf8\x12\x71\xbb\xb2\x28\x4e\x90\x33\xb8\xfe\xf8\x63\
-\xec\xdd\x66\xdb\x17\x0a\xa0\xc1\x2c\x5e\x6c\x43\xc4\x39\x17\x78\
-\x4a\x70\x5b\xde\xe1\xcb\xf7\x0e\x0c\xf6\x1b\xfc\x51\x22\x6e\x5b\
-\x66\xc3\xbe\x96\xda\x30\x62\xae\xd2\x67\xe6\xee\x91\x36\x16\x77\
-\xa1\x13\x51\xeb\x7f\xeb\x80\x4e\x28\xd5\xe5\x6e\x06\x6d\x21\x80\
-\x12\x91\x40\xfc\x9f\xfd\x5b\xa4\xb5\x4a\x24\xd0\x4f\xa9\xf8\xc9\
-\x6c\x36\x3e\xb4\x50\xba\xf8\x72\xb4\xea\x60\xd0\x5c\x20\xf4\x01\
-\x3a\x9c\x50\x00\x1d\x4e\x5b\xf8\x00\xb9\x1c\xbb\x26\x77\xc3\x06\
-\xaa\x1b\x0d\x6c\xb6\x8d\x21\x4d\xa4\x9d\x46\x03\x5b\x9d\xf0\x15\
-\xd0\xe1\x84\x02\xe8\x70\x42\x01\x74\x38\xa1\x00\x3a\x9c\x50\x00\
-\x1d\x4e\x28\x80\x0e\x27\x14\x40\x87\x13\x0a\xa0\xc3\x69\x8b\x48\
-\xe0\x5c\x18\x0d\x6c\x55\xc2\xd1\xc0\x0e\x27\x7c\x05\x74\x38\xa1\
-\x00\x3a\x9c\xb6\xf0\x01\xc2\xd1\xc0\x90\x02\xc2\xd1\xc0\xfa\x11\
-\xbe\x02\x3a\x9c\x50\x00\x1d\x4e\x5b\xf8\x00\xc5\x78\xb0\xdb\xc4\
-\x2d\xf9\xcf\xb2\xca\xdb\xc6\x86\x84\x84\x84\x84\x84\x84\x84\x84\
-\x84\x84\x4c\xf2\xff\x43\x53\x8e\x19\xff\xce\x81\x74\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x07\
-\x07\x3b\xe0\xb3\
-\x00\x70\
-\x00\x6c\x00\x75\x00\x67\x00\x69\x00\x6e\x00\x73\
-\x00\x09\
-\x0c\x92\x23\xd3\
-\x00\x4f\
-\x00\x76\x00\x65\x00\x72\x00\x6c\x00\x61\x00\x79\x00\x50\x00\x53\
-\x00\x08\
-\x0a\x61\x5a\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x6e\x18\xb3\x24\xe7\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
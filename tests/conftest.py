@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+try:
+    from geographiclib.geodesic import Geodesic
+except ImportError:
+    Geodesic = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Overlay counts and map scales the benchmarks are run for
+OVERLAY_COUNTS = [1, 10, 100, 1000]
+SCALES = [10000, 100000, 1000000]
+
+
+def overlayCenters(count, seed=0):
+    """Returns reproducible (lons, lats, azimuts) arrays of overlays
+    spread over Switzerland."""
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(6.0, 10.0, count), rng.uniform(45.9, 47.7, count),
+            rng.uniform(0.0, 360.0, count))
+
+
+# Marks the tests comparing with the reference geodesic solutions
+requiresGeographiclib = pytest.mark.skipif(
+    Geodesic is None, reason="geographiclib is not installed")
+
+
+def distances(lons1, lats1, lons2, lats2):
+    """Returns the geodesic distances in meters between two arrays of
+    positions."""
+    return np.array([Geodesic.WGS84.Inverse(lat1, lon1, lat2, lon2)["s12"]
+                     for lon1, lat1, lon2, lat2
+                     in zip(lons1, lats1, lons2, lats2)])
+
+
+def metersPerPixel(scale, dpi=96):
+    return scale * 0.0254 / dpi
+
+
+@pytest.fixture(scope="session")
+def qgisApp():
+    """Initialized QgsApplication, the tests are skipped without QGIS."""
+    qgisCore = pytest.importorskip("qgis.core")
+    app = qgisCore.QgsApplication([], False)
+    app.initQgis()
+    yield app
+    app.exitQgis()
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from kadas_overlay_ps.overlay_ps_geodesic import directBatch
+from kadas_overlay_ps.overlay_ps_geometry import OverlayPSGeometry
+from kadas_overlay_ps.overlay_ps_template import OverlayPSTemplate
+
+from conftest import overlayCenters
+
+
+def offsetPositions(lon, lat, azimut, bearing, along, cross):
+    """Returns positions along distance along the axis of the given
+    bearing and cross meters to its right."""
+    pointLons, pointLats = directBatch(lon, lat, azimut + bearing, along)
+    return directBatch(pointLons, pointLats, azimut + bearing + 90, cross)
+
+
+@pytest.mark.parametrize("tolerance", [None, 0.5])
+def test_positions_on_the_main_axis(tolerance):
+    geometry = OverlayPSGeometry(7.4, 46.9, 202.5, tolerance)
+    along = np.array([250., 1000., 3300., 6900.])
+    cross = np.array([20., -35., 0., 120.])
+    lons, lats = offsetPositions(7.4, 46.9, 202.5, 0, along, cross)
+    result = geometry.axisQuery(lons, lats)
+    assert (result["axis"] == 0).all()
+    np.testing.assert_allclose(result["along"], along, atol=0.1)
+    np.testing.assert_allclose(result["cross"], cross, atol=0.1)
+    np.testing.assert_allclose(result["distance"], np.abs(cross), atol=0.1)
+
+
+def test_positions_on_the_flight_lines():
+    template = OverlayPSGeometry(7.4, 46.9, 0.).template
+    geometry = OverlayPSGeometry(7.4, 46.9, 0., 0.5)
+    for axis, spec in enumerate(template.axes):
+        if spec["kind"] != "flightLine":
+            continue
+        lons, lats = offsetPositions(7.4, 46.9, 0., spec["bearing"],
+                                     np.array([2500., 5500.]),
+                                     np.array([-50., 50.]))
+        result = geometry.axisQuery(lons, lats)
+        assert (result["axis"] == axis).all()
+        np.testing.assert_allclose(result["along"], [2500., 5500.],
+                                   atol=0.05)
+        np.testing.assert_allclose(result["cross"], [-50., 50.], atol=0.05)
+
+
+def test_positions_beyond_the_axis_end():
+    geometry = OverlayPSGeometry(7.4, 46.9, 0.)
+    lons, lats = offsetPositions(7.4, 46.9, 0., 0, 8000., 0.)
+    result = geometry.axisQuery(lons, lats)
+    assert result["along"][0] == pytest.approx(7000., abs=0.05)
+    assert result["distance"][0] == pytest.approx(1000., abs=0.5)
+
+
+def test_positions_against_several_overlays():
+    lons, lats, azimuts = overlayCenters(3)
+    geometry = OverlayPSGeometry(lons, lats, azimuts, 0.5)
+    overlay = np.array([2, 0, 1, 2])
+    along = np.array([1500., 2500., 4000., 6000.])
+    cross = np.array([10., -10., 30., -30.])
+    posLons, posLats = offsetPositions(lons[overlay], lats[overlay],
+                                       azimuts[overlay], 0, along, cross)
+    result = geometry.axisQuery(posLons, posLats, overlay)
+    assert (result["axis"] == 0).all()
+    np.testing.assert_allclose(result["along"], along, atol=0.05)
+    np.testing.assert_allclose(result["cross"], cross, atol=0.05)
+
+
+def test_template_without_axes():
+    template = OverlayPSTemplate(
+        "ring", [{"bearing": 90, "offset": 1750, "radius": 1750,
+                  "span": 300}], [])
+    geometry = OverlayPSGeometry(7.4, 46.9, 0., 0.5, template=template)
+    result = geometry.axisQuery(np.array([7.41, 7.42]),
+                                np.array([46.9, 46.91]))
+    assert (result["axis"] == -1).all()
+    assert np.isnan(result["along"]).all()
+    assert np.isnan(result["distance"]).all()
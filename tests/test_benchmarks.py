@@ -0,0 +1,127 @@
+"""Benchmarks of the overlay geometry, transformation and rendering.
+
+Run with stored baselines to catch regressions, see README.md. The
+transform and render benchmarks need QGIS and KADAS and are skipped
+without them.
+"""
+import pytest
+
+from kadas_overlay_ps.overlay_ps_geometry import MAX_CHORD_ERROR, \
+    OverlayPSGeometry
+
+from conftest import OVERLAY_COUNTS, SCALES, metersPerPixel, \
+    overlayCenters
+
+pytest.importorskip("pytest_benchmark")
+
+
+def chordTolerance(scale):
+    return OverlayPSGeometry.roundTolerance(
+        MAX_CHORD_ERROR * metersPerPixel(scale))
+
+
+@pytest.mark.parametrize("scale", SCALES)
+@pytest.mark.parametrize("count", OVERLAY_COUNTS)
+def test_geometry(benchmark, count, scale):
+    benchmark.group = "geometry %d" % count
+    lons, lats, azimuts = overlayCenters(count)
+    tolerance = chordTolerance(scale)
+    geometry = benchmark(OverlayPSGeometry, lons, lats, azimuts, tolerance)
+    assert geometry.count == count
+
+
+@pytest.mark.parametrize("count", OVERLAY_COUNTS)
+def test_geometry_full_resolution(benchmark, count):
+    benchmark.group = "geometry %d" % count
+    lons, lats, azimuts = overlayCenters(count)
+    geometry = benchmark(OverlayPSGeometry, lons, lats, azimuts)
+    assert geometry.count == count
+
+
+@pytest.mark.parametrize("count", OVERLAY_COUNTS)
+def test_axis_query(benchmark, count):
+    benchmark.group = "axis query"
+    lons, lats, azimuts = overlayCenters(count)
+    geometry = OverlayPSGeometry(lons, lats, azimuts, 0.5)
+    posLons, posLats, overlays = overlayCenters(10000, seed=1)
+    overlays = (overlays / 360. * count).astype(int)
+    result = benchmark(geometry.axisQuery, posLons, posLats, overlays)
+    assert len(result["along"]) == 10000
+
+
+@pytest.fixture(scope="module")
+def lv95(qgisApp):
+    from qgis.core import QgsCoordinateReferenceSystem
+    return QgsCoordinateReferenceSystem("EPSG:2056")
+
+
+@pytest.mark.parametrize("scale", SCALES)
+@pytest.mark.parametrize("count", OVERLAY_COUNTS)
+def test_transform(benchmark, lv95, count, scale):
+    from kadas_overlay_ps.overlay_ps_transform import transformPool, \
+        transformCoords
+    benchmark.group = "transform %d" % count
+    lons, lats, azimuts = overlayCenters(count)
+    geometry = OverlayPSGeometry(lons, lats, azimuts, chordTolerance(scale))
+    ct = transformPool.fromWgs84(lv95)
+    xs, ys = benchmark(transformCoords, ct, geometry.lons, geometry.lats)
+    assert xs.shape == geometry.lons.shape
+
+
+def overlayLayer(count):
+    from qgis.core import QgsCoordinateReferenceSystem, QgsPointXY
+    from kadas_overlay_ps.overlay_ps_layer import OverlayPSLayer
+    lons, lats, azimuts = overlayCenters(count)
+    layer = OverlayPSLayer("benchmark")
+    crs = QgsCoordinateReferenceSystem("EPSG:4326")
+    if count == 1:
+        layer.setup(QgsPointXY(lons[0], lats[0]), crs, azimuts[0])
+    else:
+        layer.setCrs(crs, False)
+        layer.overlayCollection().addOverlays(lons, lats, azimuts)
+    return layer
+
+
+def mapSettings(layer, crs, scale, size=1000):
+    """Returns map settings showing the center of the layer extent at the
+    given scale."""
+    from qgis.PyQt.QtCore import QSize
+    from qgis.core import QgsCoordinateTransform, QgsMapSettings, \
+        QgsProject, QgsRectangle
+    center = QgsCoordinateTransform(layer.crs(), crs, QgsProject.instance(
+        )).transform(layer.extent().center())
+    half = 0.5 * size * metersPerPixel(scale)
+    settings = QgsMapSettings()
+    settings.setDestinationCrs(crs)
+    settings.setOutputSize(QSize(size, size))
+    settings.setOutputDpi(96)
+    settings.setLayers([layer])
+    settings.setExtent(QgsRectangle(center.x() - half, center.y() - half,
+                                    center.x() + half, center.y() + half))
+    return settings
+
+
+@pytest.mark.parametrize("scale", SCALES)
+@pytest.mark.parametrize("count", OVERLAY_COUNTS)
+def test_render(benchmark, lv95, count, scale):
+    """Renders offscreen into an image, without replaying the previous
+    frame. The geometry is cached after the first round."""
+    pytest.importorskip("kadas.kadascore")
+    from qgis.PyQt.QtGui import QImage, QPainter
+    from qgis.core import QgsMapRendererCustomPainterJob
+    benchmark.group = "render %d" % count
+    layer = overlayLayer(count)
+    settings = mapSettings(layer, lv95, scale)
+    image = QImage(settings.outputSize(), QImage.Format_ARGB32_Premultiplied)
+
+    def render():
+        layer.pictureCache.clear()
+        image.fill(0)
+        painter = QPainter(image)
+        job = QgsMapRendererCustomPainterJob(settings, painter)
+        job.renderSynchronously()
+        painter.end()
+        return job
+
+    job = benchmark(render)
+    assert not job.errors()
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from conftest import overlayCenters
+
+
+@pytest.fixture
+def prepared(qgisApp):
+    from qgis.core import QgsCoordinateReferenceSystem
+    from kadas_overlay_ps.overlay_ps_collection import \
+        OverlayPSPreparedCollection
+    from kadas_overlay_ps.overlay_ps_template import OverlayPSTemplate
+    lons, lats, azimuts = overlayCenters(40)
+    collection = OverlayPSPreparedCollection(
+        None, lons, lats, azimuts, np.zeros(40, dtype=np.int32),
+        QgsCoordinateReferenceSystem("EPSG:4326"),
+        OverlayPSTemplate.default())
+    collection.maxCachedOverlays = 16
+    return collection
+
+
+@pytest.fixture
+def computed(monkeypatch):
+    """Records the number of overlays of each geometry computed by the
+    collections."""
+    from kadas_overlay_ps import overlay_ps_collection
+    counts = []
+    geometryClass = overlay_ps_collection.OverlayPSGeometry
+
+    def geometry(lons, lats, *args, **kwargs):
+        counts.append(len(lons))
+        return geometryClass(lons, lats, *args, **kwargs)
+
+    monkeypatch.setattr(overlay_ps_collection, "OverlayPSGeometry",
+                        geometry)
+    return counts
+
+
+def test_geometry_computes_missing_overlays_only(prepared, computed):
+    geometry = prepared.geometry(np.arange(0, 10), 2.0)
+    assert geometry.count == 10
+    prepared.geometry(np.arange(5, 15), 2.0)
+    assert computed == [10, 5]
+
+
+def test_geometry_beyond_the_cache_size_is_not_recomputed(prepared,
+                                                          computed):
+    rows = np.arange(0, 30)
+    for i in range(3):
+        geometry = prepared.geometry(rows, 2.0)
+        assert geometry.count == 30
+    assert computed == [30]
+
+    # When full, the cached overlays requested again are kept
+    prepared.geometry(np.arange(20, 40), 2.0)
+    assert computed == [30, 10]
+    assert prepared.geometryCache[2.0]["size"] == 20
+
+
+def test_geometry_matches_direct_construction(prepared):
+    from kadas_overlay_ps.overlay_ps_geometry import OverlayPSGeometry
+    rows = np.array([3, 17, 8, 31])
+    prepared.geometry(np.arange(0, 10), 2.0)
+    geometry = prepared.geometry(rows, 2.0)
+    expected = OverlayPSGeometry(
+        prepared.wgsLons[rows], prepared.wgsLats[rows],
+        prepared.azimuts[rows], 2.0, prepared.latitude)
+    np.testing.assert_allclose(geometry.lons, expected.lons, atol=1E-9)
+    np.testing.assert_allclose(geometry.lats, expected.lats, atol=1E-9)
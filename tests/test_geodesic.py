@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from kadas_overlay_ps.overlay_ps_geodesic import TangentPlane, directBatch
+
+from conftest import Geodesic, distances, overlayCenters, \
+    requiresGeographiclib
+
+pytestmark = requiresGeographiclib
+
+
+def karneyDirect(lons, lats, azimuths, distances):
+    results = [Geodesic.WGS84.Direct(lat, lon, azimuth, distance)
+               for lon, lat, azimuth, distance
+               in zip(lons, lats, azimuths, distances)]
+    return np.array([result["lon2"] for result in results]), \
+        np.array([result["lat2"] for result in results])
+
+
+def test_direct_batch_matches_geographiclib():
+    rng = np.random.default_rng(1)
+    lons = rng.uniform(-180, 180, 500)
+    lats = rng.uniform(-85, 85, 500)
+    azimuths = rng.uniform(0, 360, 500)
+    lengths = rng.uniform(0, 20000, 500)
+    lons2, lats2 = directBatch(lons, lats, azimuths, lengths)
+    expectedLons, expectedLats = karneyDirect(lons, lats, azimuths, lengths)
+    assert distances(lons2, lats2, expectedLons, expectedLats).max() < 1E-3
+
+
+def test_direct_batch_broadcasts():
+    lons, lats, azimuths = overlayCenters(3)
+    lons2, lats2 = directBatch(lons[:, np.newaxis], lats[:, np.newaxis],
+                               np.array([0, 90, 180, 270]), 1000)
+    assert lons2.shape == (3, 4)
+    expectedLons, expectedLats = karneyDirect(
+        np.repeat(lons, 4), np.repeat(lats, 4),
+        np.tile([0, 90, 180, 270], 3), np.full(12, 1000))
+    assert distances(lons2.ravel(), lats2.ravel(), expectedLons,
+                     expectedLats).max() < 1E-3
+
+
+def test_direct_batch_wraps_antimeridian():
+    lons2, lats2 = directBatch(179.99, 0, 90, 5000)
+    assert -180 <= lons2 < -179.9
+
+
+def test_tangent_plane_round_trip():
+    lons, lats, azimuths = overlayCenters(50)
+    plane = TangentPlane(lons[:, np.newaxis], lats[:, np.newaxis])
+    rng = np.random.default_rng(2)
+    east = rng.uniform(-8000, 8000, (50, 20))
+    north = rng.uniform(-8000, 8000, (50, 20))
+    lons2, lats2 = plane.toGeodetic(east, north)
+    # Plane points lie above the ellipsoid, their projections along the
+    # normal only come back to within a few centimeters
+    east2, north2 = plane.fromGeodetic(lons2, lats2)
+    assert np.abs(east2 - east).max() < 0.02
+    assert np.abs(north2 - north).max() < 0.02
+
+
+def test_tangent_plane_direct_is_close_to_geodesic():
+    lons, lats, azimuths = overlayCenters(50)
+    plane = TangentPlane(lons[:, np.newaxis], lats[:, np.newaxis])
+    zeros = np.zeros((50, 1))
+    east, north = plane.direct(zeros, zeros, azimuths[:, np.newaxis], 7000)
+    lons2, lats2 = plane.toGeodetic(east, north)
+    expectedLons, expectedLats = karneyDirect(lons, lats, azimuths,
+                                              np.full(50, 7000))
+    assert distances(lons2[:, 0], lats2[:, 0], expectedLons,
+                     expectedLats).max() < 0.1
@@ -0,0 +1,181 @@
+import numpy as np
+import pytest
+
+from kadas_overlay_ps.overlay_ps_geometry import OverlayPSGeometry
+from kadas_overlay_ps.overlay_ps_template import OverlayPSTemplate
+
+from conftest import Geodesic, distances, overlayCenters, \
+    requiresGeographiclib
+
+
+def baselineOverlay(lon, lat, azimut):
+    """Constructs the ring, axis end points and kilometer marks of an
+    overlay vertex by vertex, as the renderer did before the geometry was
+    vectorized.
+
+    :returns: Dictionary of (lons, lats) arrays of the "ring" vertices,
+        the "axisEnds" and the "marks" as (p1, point, p2) triples in
+        template order, and the list of mark "labels".
+    """
+    geod = Geodesic.WGS84
+
+    def direct(lon, lat, azimuth, distance):
+        result = geod.Direct(lat, lon, azimuth, distance)
+        return result["lon2"], result["lat2"]
+
+    ring = []
+    ringCenter = direct(lon, lat, azimut + 90, 1750)
+    for a in range(-150, 151):
+        ring.append(direct(ringCenter[0], ringCenter[1], azimut + 90 + a,
+                           1750))
+
+    axisEnds = []
+    marks = []
+    labels = []
+    axes = [(0, False, range(0, 8), 7000),
+            (180, True, range(0, 8), 7000),
+            (45, False, range(2, 7), 6000),
+            (90, False, range(2, 7), 6000),
+            (135, True, range(2, 7), 6000)]
+    for bearing, flip, kilometers, length in axes:
+        axisEnds.append(direct(lon, lat, azimut + bearing, length))
+        s = -1 if flip else 1
+        for km in kilometers:
+            point = direct(lon, lat, azimut + bearing, km * 1000)
+            marks.append(direct(point[0], point[1],
+                                azimut + bearing + 90 * s, 250))
+            marks.append(point)
+            marks.append(direct(point[0], point[1],
+                                azimut + bearing + 270 * s, 250))
+            labels.append("%d" % km if km > 0 else None)
+    return {
+        "ring": np.array(ring).T,
+        "axisEnds": np.array(axisEnds).T,
+        "marks": np.array(marks).T,
+        "labels": labels
+    }
+
+
+@requiresGeographiclib
+@pytest.mark.parametrize("planeTolerance", [0.1, None])
+def test_geometry_matches_baseline(planeTolerance):
+    lons, lats, azimuts = overlayCenters(5)
+    geometry = OverlayPSGeometry(lons, lats, azimuts,
+                                 planeTolerance=planeTolerance)
+    rings = [start for (start, end), kind
+             in zip(geometry.parts, geometry.partKinds) if kind == "ring"]
+    axisEnds = [end - 1 for (start, end), kind
+                in zip(geometry.parts, geometry.partKinds) if kind != "ring"]
+    for idx in range(len(lons)):
+        baseline = baselineOverlay(lons[idx], lats[idx], azimuts[idx])
+        assert geometry.markLabels == baseline["labels"]
+
+        start, end = geometry.parts[rings[0]]
+        assert end - start == 301
+        for name, vertices in (
+                ("ring", np.arange(start, end)),
+                ("axisEnds", np.array(axisEnds)),
+                ("marks", np.arange(geometry.marksOffset,
+                                    geometry.lons.shape[1]))):
+            error = distances(geometry.lons[idx, vertices],
+                              geometry.lats[idx, vertices],
+                              *baseline[name])
+            assert error.max() < OverlayPSGeometry.planeTolerance, name
+
+
+@requiresGeographiclib
+def test_axis_vertices_lie_on_the_axes():
+    lons, lats, azimuts = overlayCenters(3)
+    geometry = OverlayPSGeometry(lons, lats, azimuts, 2.0)
+    template = geometry.template
+    rings = len(geometry.parts) - len(template.axes)
+    for axis, (start, end) in zip(template.axes, geometry.parts[rings:]):
+        for idx in range(len(lons)):
+            line = Geodesic.WGS84.DirectLine(
+                lats[idx], lons[idx], azimuts[idx] + axis["bearing"],
+                axis["length"])
+            error = []
+            for vertex in range(start, end):
+                along = Geodesic.WGS84.Inverse(
+                    lats[idx], lons[idx], geometry.lats[idx, vertex],
+                    geometry.lons[idx, vertex])["s12"]
+                position = line.Position(along)
+                error.append(distances(
+                    [geometry.lons[idx, vertex]],
+                    [geometry.lats[idx, vertex]],
+                    [position["lon2"]], [position["lat2"]])[0])
+            assert max(error) < OverlayPSGeometry.planeTolerance
+
+
+@requiresGeographiclib
+def test_plane_construction_falls_back_near_the_poles():
+    lons = np.array([7.4, 7.4])
+    lats = np.array([46.9, 89.95])
+    geometry = OverlayPSGeometry(lons, lats, 30.)
+    exact = OverlayPSGeometry(lons, lats, 30., planeTolerance=None)
+    error = distances(geometry.lons.ravel(), geometry.lats.ravel(),
+                      exact.lons.ravel(), exact.lats.ravel())
+    assert error.max() < OverlayPSGeometry.planeTolerance
+
+
+@requiresGeographiclib
+@pytest.mark.parametrize("size", [12000, 14000, 16000])
+def test_plane_construction_bounds_large_rings(size):
+    template = OverlayPSTemplate(
+        "large", [{"bearing": 90, "offset": size, "radius": size,
+                   "span": 300}],
+        [{"kind": "mainAxis", "bearing": 0, "flip": False, "start": 0,
+          "length": 7000, "markStart": 0, "markSpacing": 1000,
+          "labels": True}])
+    lons, lats, azimuts = overlayCenters(10)
+    lats = np.full(10, 46.9)
+    geometry = OverlayPSGeometry(lons, lats, azimuts, template=template)
+    exact = OverlayPSGeometry(lons, lats, azimuts, planeTolerance=None,
+                              template=template)
+    error = distances(geometry.lons.ravel(), geometry.lats.ravel(),
+                      exact.lons.ravel(), exact.lats.ravel())
+    assert error.max() < OverlayPSGeometry.planeTolerance
+
+
+def test_batches_match_single_overlays():
+    lons, lats, azimuts = overlayCenters(4)
+    latitude = float(np.abs(lats).max())
+    batch = OverlayPSGeometry(lons, lats, azimuts, 4.0, latitude)
+    for idx in range(len(lons)):
+        single = OverlayPSGeometry(lons[idx], lats[idx], azimuts[idx], 4.0,
+                                   latitude)
+        assert single.lons.shape == (1, batch.lons.shape[1])
+        np.testing.assert_allclose(single.lons[0], batch.lons[idx],
+                                   atol=1E-9)
+        np.testing.assert_allclose(single.lats[0], batch.lats[idx],
+                                   atol=1E-9)
+
+
+def test_vertex_count_follows_the_tolerance():
+    counts = [OverlayPSGeometry(7.4, 46.9, 0., tolerance).lons.shape[1]
+              for tolerance in (0.25, 2.0, 16.0, 128.0)]
+    assert counts == sorted(counts, reverse=True)
+    assert counts[-1] < counts[0]
+
+
+def test_geometry_is_read_only():
+    geometry = OverlayPSGeometry(7.4, 46.9, 0.)
+    with pytest.raises(ValueError):
+        geometry.lons[0, 0] = 0
+
+
+def test_round_tolerance():
+    assert OverlayPSGeometry.roundTolerance(None) is None
+    assert OverlayPSGeometry.roundTolerance(3.0) == 2.0
+    assert OverlayPSGeometry.roundTolerance(0.3) == 0.25
+
+
+def test_template_programs_are_cached():
+    template = OverlayPSTemplate.default()
+    assert template.compile(2.0, 46.9) is template.compile(2.0, 46.9)
+    assert template.compile(2.0, 46.9) is not template.compile(4.0, 46.9)
+
+
+def test_template_validation():
+    with pytest.raises(ValueError):
+        OverlayPSTemplate("invalid", [], [{"kind": "mainAxis"}])
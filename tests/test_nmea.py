@@ -0,0 +1,57 @@
+import pytest
+
+from kadas_overlay_ps.overlay_ps_nmea import parseNmea
+
+
+def sentence(body):
+    """Returns the NMEA sentence of body with its checksum."""
+    checksum = 0
+    for char in body:
+        checksum ^= ord(char)
+    return "$%s*%02X\r\n" % (body, checksum)
+
+
+GGA = "GPGGA,123519,4654.000,N,00724.000,E,1,08,0.9,545.4,M,46.9,M,,"
+RMC = "GPRMC,123519,A,4654.000,N,00724.000,E,022.4,084.4,230394,003.1,W"
+
+
+@pytest.mark.parametrize("body", [GGA, RMC, GGA.replace("GPGGA", "GNGGA")])
+def test_fix(body):
+    lon, lat = parseNmea(sentence(body))
+    assert lon == pytest.approx(7.4)
+    assert lat == pytest.approx(46.9)
+
+
+def test_without_checksum():
+    assert parseNmea("$" + GGA) == pytest.approx((7.4, 46.9))
+
+
+def test_hemispheres():
+    body = GGA.replace(",N,", ",S,").replace(",E,", ",W,")
+    assert parseNmea(sentence(body)) == pytest.approx((-7.4, -46.9))
+    body = RMC.replace(",N,", ",S,").replace(",E,", ",W,")
+    assert parseNmea(sentence(body)) == pytest.approx((-7.4, -46.9))
+
+
+def test_checksum_mismatch():
+    assert parseNmea(sentence(GGA).replace("4654", "4655")) is None
+    assert parseNmea("$" + GGA + "*ZZ") is None
+
+
+@pytest.mark.parametrize("body", [
+    # GGA without fix, void RMC
+    GGA.replace(",E,1,", ",E,0,"),
+    GGA.replace(",E,1,", ",E,,"),
+    RMC.replace(",A,", ",V,"),
+    # Other sentences, truncated and malformed ones
+    "GPGSA,A,3,04,05,,09,12,,,24,,,,,2.5,1.3,2.1",
+    "GPGGA,123519",
+    GGA.replace("4654.000", "xx54.000"),
+])
+def test_no_position(body):
+    assert parseNmea(sentence(body)) is None
+
+
+def test_not_a_sentence():
+    assert parseNmea("") is None
+    assert parseNmea(GGA) is None